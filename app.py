@@ -22,6 +22,7 @@ ROUTE_TEMPLATES = {
     "/timetable": "timetable.html",
     "/import": "import-data.html",
 }
+ROUTE_TEMPLATE_KEYS: frozenset[str] = frozenset(ROUTE_TEMPLATES)
 
 DB_HOST = os.getenv("DB_HOST")
 DB_PORT = os.getenv("DB_PORT", "5432")
@@ -129,6 +129,28 @@ def app(monkeypatch):
     return flask_app
 
 
+@pytest.fixture(scope="session")
+def app_rules_by_method():
+    """Registered rule paths grouped by HTTP method, built once per session."""
+    rules_by_method = {"GET": set(), "POST": set()}
+    for rule in flask_app.url_map.iter_rules():
+        for method in rules_by_method:
+            if method in rule.methods:
+                rules_by_method[method].add(rule.rule)
+    return {method: frozenset(rules) for method, rules in rules_by_method.items()}
+
+
+@pytest.fixture(scope="session")
+def rule_map():
+    """Map of rule path -> werkzeug Rule, keeping the most permissive duplicate."""
+    rules = {}
+    for rule in flask_app.url_map.iter_rules():
+        existing = rules.get(rule.rule)
+        if existing is None or len(rule.methods) > len(existing.methods):
+            rules[rule.rule] = rule
+    return rules
+
+
 @pytest.fixture()
 def client(app, request):
     # Skip only tests explicitly marked "integration" when no DB exists
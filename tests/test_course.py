@@ -1,5 +1,5 @@
 import pytest
-from course import Course, parse_time_to_minutes
+from course import Course, parse_time_to_minutes, csv_field_getter, CSV_FIELDS
 from course_element import CourseElement
 from day import Day
 
@@ -16,6 +16,15 @@ def test_parse_time_with_seconds():
     assert parse_time_to_minutes("8:45:00") == 525
 
 
+def test_parse_time_zero_padded_colon_format():
+    assert parse_time_to_minutes("08:45:00") == 525
+
+
+def test_parse_time_out_of_range_raises():
+    with pytest.raises(ValueError):
+        parse_time_to_minutes("24.00.00")
+
+
 def test_parse_time_empty_raises():
     with pytest.raises(ValueError):
         parse_time_to_minutes("")
@@ -52,6 +61,14 @@ def test_from_csv_row_basic():
     assert course.lecture.end == 780
 
 
+def test_from_row_normalizes_subject():
+    values = (" coen ", " 311 ", "00001", "TuTh", "11:45", "13:00",
+              "", "", "", "", "", "")
+    course = Course.from_row(values)
+    assert course.subject == "COEN"
+    assert course.catalog_nbr == "311"
+
+
 def test_from_csv_row_no_labs_no_tuts():
     row = {
         "subject": "ENGR",
@@ -93,3 +110,101 @@ def test_day_codes_property():
     assert 9 in codes   # TU week 2
     assert 4 in codes   # TH week 1
     assert 11 in codes  # TH week 2
+    assert codes == (2, 9, 4, 11)
+
+
+def test_from_row_matches_from_csv_row():
+    values = ("COEN", "311", "00001", "TuTh", "11:45", "13:00",
+              "2", "1", "165", "1", "1", "50")
+    assert Course.from_row(values) == Course.from_csv_row(dict(zip(CSV_FIELDS, values)))
+
+
+def test_csv_field_getter_reorders_columns():
+    header = list(reversed(CSV_FIELDS))
+    row = [f"v_{name}" for name in header]
+    assert csv_field_getter(header)(row) == tuple(f"v_{name}" for name in CSV_FIELDS)
+
+
+def test_csv_field_getter_missing_header_raises():
+    with pytest.raises(KeyError):
+        csv_field_getter(CSV_FIELDS[:-1])
+
+
+def test_from_csv_row_placeholders_are_distinct():
+    values = ("COEN", "311", "00001", "TuTh", "11:45", "13:00",
+              "2", "1", "165", "0", "0", "0")
+    course = Course.from_row(values)
+    assert course.lab[0] is not course.lab[1]
+    assert course.tutorial == ()
+
+
+def test_day_mask_property():
+    values = ("COEN", "212", "00001", "TuTh", "11:45", "13:00",
+              "", "", "", "", "", "")
+    course = Course.from_row(values)
+    assert course.day_mask == (1 << 2) | (1 << 9) | (1 << 4) | (1 << 11)
+    assert course.day_mask & (1 << 9)
+    assert not course.day_mask & (1 << 1)
+
+
+def test_bulk_from_csv(tmp_path):
+    path = tmp_path / "Data.csv"
+    values = ("coen", "311", "00001", "TuTh", "11:45", "13:00",
+              "2", "1", "165", "1", "1", "50")
+    path.write_text(",".join(CSV_FIELDS) + "\n" + ",".join(values) + "\n\n", encoding="utf-8")
+    assert Course.bulk_from_csv(str(path)) == [Course.from_row(values)]
+
+
+def test_bulk_from_csv_empty_file(tmp_path):
+    path = tmp_path / "Data.csv"
+    path.write_text("", encoding="utf-8")
+    assert Course.bulk_from_csv(str(path)) == []
+
+
+def test_bulk_from_csv_missing_header_raises(tmp_path):
+    path = tmp_path / "Data.csv"
+    path.write_text("subject,catalog_nbr\nCOEN,311\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="header"):
+        Course.bulk_from_csv(str(path))
+
+
+def test_stream_from_csv_chunks_and_filters(tmp_path):
+    path = tmp_path / "Data.csv"
+    lines = [",".join(CSV_FIELDS)]
+    for subject, catalog in (("COEN", "311"), ("MECH", "221"), ("ELEC", "273"), ("COEN", "212")):
+        lines.append(f"{subject},{catalog},00001,TuTh,11:45,13:00,0,0,0,0,0,0")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    chunks = list(Course.stream_from_csv(str(path), chunksize=2,
+                                         include=lambda subject, catalog: subject != "MECH"))
+    assert [[c.catalog_nbr for c in chunk] for chunk in chunks] == [["311", "273"], ["212"]]
+
+
+def test_clone_is_independent():
+    values = ("COEN", "311", "00001", "TuTh", "11:45", "13:00",
+              "2", "1", "165", "1", "1", "50")
+    course = Course.from_row(values)
+    course.lab[0].day, course.lab[0].start, course.lab[0].end = [1, 8], 840, 1005
+    course.lab[0].bldg, course.lab[0].room = "H", "801"
+
+    clone = course.clone()
+    assert clone == course
+    assert clone.lab[0] is not course.lab[0]
+    assert clone.lab[0].day is not course.lab[0].day
+    assert clone.tutorial[0] is not course.tutorial[0]
+
+    clone.lab[0].day.append(3)
+    clone.tutorial[0].start = 600
+    assert course.lab[0].day == [1, 8]
+    assert course.tutorial[0].start == 0
+
+
+def test_clone_keeps_missing_elements():
+    course = Course(subject="COEN", catalog_nbr="311", class_nbr="00001", lecture=None,
+                    lab=(None, CourseElement(day=[1], start=525, end=690)), tutorial=(None,),
+                    lab_count=2, tut_count=1)
+    clone = course.clone()
+    assert clone == course
+    assert clone.lecture is None
+    assert clone.lab[0] is None and clone.tutorial == (None,)
+    assert clone.lab[1] is not course.lab[1]
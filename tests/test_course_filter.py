@@ -1,4 +1,12 @@
-from course_filter import should_include_course, filter_course_list
+from course_filter import (
+    should_include_course,
+    should_include_course_all_elec,
+    should_include_course_canon,
+    filter_course_list,
+    get_included_subjects,
+    get_partial_course_codes,
+    EXCLUDED_ELEC_COURSES,
+)
 
 
 def test_coen_included():
@@ -16,6 +24,30 @@ def test_elec_excluded():
         assert should_include_course("ELEC", catalog) is False
 
 
+def test_excluded_elec_is_frozen():
+    assert isinstance(EXCLUDED_ELEC_COURSES, frozenset)
+    assert "430" in EXCLUDED_ELEC_COURSES
+
+
+def test_included_subjects():
+    assert get_included_subjects() == ("COEN", "ELEC")
+
+
+def test_partial_course_codes():
+    assert get_partial_course_codes() == ["ENGR 290"]
+
+
+def test_elec_excluded_kept_without_filter():
+    assert should_include_course("ELEC", "430", filter_excluded_elec=False) is True
+    assert should_include_course("ENGR", "301", filter_excluded_elec=False) is False
+
+
+def test_all_elec_helper_matches_unfiltered_call():
+    assert should_include_course_all_elec("ELEC", "430") is True
+    assert should_include_course_all_elec(" coen ", "311") is True
+    assert should_include_course_all_elec("ENGR", "301") is False
+
+
 def test_engr_290_included():
     assert should_include_course("ENGR", "290") is True
 
@@ -29,6 +61,18 @@ def test_random_subject_excluded():
     assert should_include_course("COMP", "353") is False
 
 
+def test_mixed_case_and_padding_normalized():
+    assert should_include_course(" coen ", " 311 ") is True
+    assert should_include_course("elec", "430 ") is False
+
+
+def test_canon_matches_normalized_input():
+    assert should_include_course_canon("COEN", "311") is True
+    assert should_include_course_canon("ELEC", "430") is False
+    assert should_include_course_canon("ENGR", "290") is True
+    assert should_include_course_canon("MATH", "201") is False
+
+
 def test_filter_course_list():
     courses = [
         {"subject": "COEN", "catalog": "311"},
@@ -38,3 +82,10 @@ def test_filter_course_list():
     filtered, excluded_count = filter_course_list(courses, "subject", "catalog")
     assert len(filtered) == 2
     assert excluded_count == 1
+
+
+def test_filter_course_list_missing_fields_excluded():
+    courses = [{"subject": "COEN", "catalog": "311"}, {"subject": "COEN"}, {}]
+    filtered, excluded_count = filter_course_list(courses)
+    assert filtered == [{"subject": "COEN", "catalog": "311"}, {"subject": "COEN"}]
+    assert excluded_count == 1
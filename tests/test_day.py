@@ -45,3 +45,11 @@ def test_parse_day_pattern_invalid_raises():
 def test_parse_day_pattern_empty_raises():
     with pytest.raises(ValueError):
         parse_day_pattern("")
+
+
+def test_parse_day_pattern_cached():
+    assert parse_day_pattern("MoWe") is parse_day_pattern("MoWe")
+
+
+def test_parse_day_pattern_strips_separators():
+    assert parse_day_pattern("Mo, We / Fr") == (Day.MO, Day.WE, Day.FR)
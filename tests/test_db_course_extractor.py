@@ -10,7 +10,12 @@ from helper.db_course_extractor import (
     determine_lab_frequency,
     determine_tutorial_frequency,
     group_by_lecture,
+    fetch_schedule_data,
+    generate_data_csv,
+    iter_data_rows,
 )
+import helper.db_course_extractor as db_course_extractor
+import course
 
 
 # --- build_termcode ---
@@ -27,6 +32,10 @@ def test_termcode_2024_summer():
     assert build_termcode(2024, 6) == "2246"
 
 
+def test_termcode_zero_padded_year():
+    assert build_termcode(2005, 2) == "2052"
+
+
 # --- parse_time_to_dotted ---
 
 def test_parse_time_from_time_obj():
@@ -42,6 +51,14 @@ def test_parse_time_from_bad_string():
     assert parse_time_to_dotted("not-a-time") == "00.00.00"
 
 
+def test_parse_time_from_out_of_range_string():
+    assert parse_time_to_dotted("25:00:00") == "00.00.00"
+
+
+def test_parse_time_from_single_digit_hour():
+    assert parse_time_to_dotted("9:05:00") == "09.05.00"
+
+
 def test_parse_time_from_none():
     assert parse_time_to_dotted(None) == "00.00.00"
 
@@ -88,6 +105,40 @@ def test_day_pattern_empty():
     assert parse_day_pattern(row) == ""
 
 
+def test_day_pattern_mixed_values():
+    row = {'mondays': 1, 'tuesdays': None, 'wednesdays': 'TRUE',
+           'thursdays': 0, 'fridays': 'false', 'saturdays': False, 'sundays': 'True'}
+    assert parse_day_pattern(row) == "MoWeSu"
+
+
+def test_day_pattern_missing_columns():
+    assert parse_day_pattern({'wednesdays': True}) == "We"
+
+
+def test_day_pattern_all_days():
+    row = {'mondays': True, 'tuesdays': True, 'wednesdays': True,
+           'thursdays': True, 'fridays': True, 'saturdays': True, 'sundays': True}
+    assert parse_day_pattern(row) == "MoTuWeThFrSaSu"
+
+
+# --- fetch_schedule_data ---
+
+def test_fetch_schedule_data_filters_in_sql(monkeypatch):
+    calls = []
+    monkeypatch.setattr(db_course_extractor, "fetch_all",
+                        lambda sql, params=None: calls.append((sql, params)) or [])
+    assert fetch_schedule_data("2252") == []
+    sql, params = calls[0]
+    assert "'COEN'" not in sql
+    assert params[:4] == ("2252", "ELECCOEN", ["COEN", "ELEC"], ["ENGR 290"])
+    assert "430" in params[4]
+
+
+def test_fetch_schedule_data_stream_uses_fetch_iter(monkeypatch):
+    monkeypatch.setattr(db_course_extractor, "fetch_iter", lambda sql, params=None: iter([{'subject': 'COEN'}]))
+    assert list(fetch_schedule_data("2252", stream=True)) == [{'subject': 'COEN'}]
+
+
 # --- extract_base_section ---
 
 def test_base_section_lec():
@@ -151,9 +202,49 @@ def test_group_basic():
     assert len(grouped[key]['labs']) == 1
 
 
+def test_group_ignores_other_components():
+    records = [
+        {'subject': 'COEN', 'catalog': '311', 'section': 'AA', 'componentcode': 'SEM'},
+    ]
+    assert group_by_lecture(records) == {}
+
+
 def test_group_filters_math():
     records = [
         {'subject': 'MATH', 'catalog': '201', 'section': 'AA', 'componentcode': 'LEC'},
     ]
     grouped = group_by_lecture(records)
     assert len(grouped) == 0
+
+
+# --- generate_data_csv ---
+
+def _schedule_record(section, component, start, end, **days):
+    record = {'subject': 'COEN', 'catalog': '311', 'section': section, 'componentcode': component,
+              'classstarttime': start, 'classendtime': end}
+    record.update({day: days.get(day, False) for day in
+                   ('mondays', 'tuesdays', 'wednesdays', 'thursdays', 'fridays', 'saturdays', 'sundays')})
+    return record
+
+
+def test_generate_data_csv_writes_rows(monkeypatch, tmp_path):
+    records = [
+        _schedule_record('AA', 'LEC', time(11, 45), time(13, 0), tuesdays=True, thursdays=True),
+        _schedule_record('AA T1', 'TUT', time(9, 0), time(9, 50), fridays=True),
+    ]
+    monkeypatch.setattr(db_course_extractor, "fetch_schedule_data", lambda *args, **kwargs: iter(records))
+    path = tmp_path / "Data.csv"
+    assert generate_data_csv(str(path)) == 1
+    lines = path.read_text(encoding="utf-8-sig").splitlines()
+    assert lines[0] == ",".join(course.CSV_FIELDS)
+    assert lines[1] == "COEN,311,AA,TuTh,11.45.00,13.00.00,,,,1,1,50"
+
+
+def test_iter_data_rows_skips_sections_without_lecture():
+    grouped = group_by_lecture([
+        _schedule_record('AA', 'LEC', time(8, 45), time(10, 0), mondays=True, wednesdays=True),
+        _schedule_record('BB L1', 'LAB', time(14, 0), time(16, 45), fridays=True),
+    ])
+    assert list(iter_data_rows(grouped)) == [
+        ('COEN', '311', 'AA', 'MoWe', '08.45.00', '10.00.00', '', '', '', '', '', ''),
+    ]
@@ -1,8 +1,10 @@
 import pytest
+from course_filter import should_include_course_all_elec as should_include_course
 from helper.db_room_extractor import (
-    should_include_course,
     group_courses_by_room,
+    generate_room_data_csv,
 )
+import helper.db_room_extractor as db_room_extractor
 
 
 # --- should_include_course ---
@@ -56,3 +58,37 @@ def test_group_no_duplicates():
 def test_group_empty():
     grouped = group_courses_by_room([])
     assert len(grouped) == 0
+
+
+# --- fetch_course_lab_assignments ---
+
+def test_fetch_course_lab_assignments_filters_in_sql(monkeypatch):
+    calls = []
+    monkeypatch.setattr(db_room_extractor, "fetch_all",
+                        lambda sql, params=None: calls.append((sql, params)) or [])
+    assert db_room_extractor.fetch_course_lab_assignments() == []
+    sql, params = calls[0]
+    assert "= ANY(%s)" in sql
+    assert params == (["COEN", "ELEC"], ["ENGR 290"])
+
+
+# --- generate_room_data_csv ---
+
+def test_generate_room_data_csv_pads_course_columns(monkeypatch, tmp_path):
+    monkeypatch.setattr(db_room_extractor, "fetch_lab_rooms", lambda: {
+        1: {'building': 'H', 'room': '801'},
+        2: {'building': 'H', 'room': '803'},
+    })
+    monkeypatch.setattr(db_room_extractor, "fetch_course_lab_assignments", lambda: [
+        {'labroomid': 1, 'subject': 'COEN', 'catalog': '311', 'comments': ''},
+        {'labroomid': 1, 'subject': 'COEN', 'catalog': '212', 'comments': ''},
+        {'labroomid': 2, 'subject': 'ELEC', 'catalog': '273', 'comments': ''},
+        {'labroomid': 9, 'subject': 'COEN', 'catalog': '346', 'comments': ''},
+    ])
+    path = tmp_path / "Room_data.csv"
+    assert generate_room_data_csv(str(path)) == 2
+    assert path.read_text(encoding="utf-8").splitlines() == [
+        "bldg,room,subject,course1,course2",
+        "H,801,COEN,212,311",
+        "H,803,ELEC,273,",
+    ]
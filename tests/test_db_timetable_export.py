@@ -1,9 +1,15 @@
 import pytest
+from unittest.mock import MagicMock
 from helper.db_timetable_export import (
     day_number_to_day_columns,
+    day_number_to_day_flags,
     minutes_to_time,
     extract_day_numbers,
+    iter_day_numbers,
+    insert_schedule_records,
 )
+import helper.db_timetable_export as db_timetable_export
+from course import Course
 from day import Day
 
 
@@ -44,6 +50,12 @@ def test_day_cols_all_days_present():
     assert set(result.keys()) == expected_keys
 
 
+def test_day_flags_match_columns():
+    for day_num in (1, 2, 3, 4, 5, 8, 9, 10, 11, 12, 99):
+        assert day_number_to_day_flags(day_num) == tuple(day_number_to_day_columns(day_num).values())
+    assert day_number_to_day_flags(10) == (False, False, True, False, False, False, False)
+
+
 # --- minutes_to_time ---
 
 def test_time_morning():
@@ -58,6 +70,11 @@ def test_time_midnight():
     assert minutes_to_time(0) == "00:00:00"
 
 
+def test_time_end_of_day():
+    assert minutes_to_time(1440) == "24:00:00"
+    assert minutes_to_time(1500) == "25:00:00"
+
+
 # --- extract_day_numbers ---
 
 def test_extract_int():
@@ -71,3 +88,33 @@ def test_extract_int_week2():
 def test_extract_non_matching():
     result = extract_day_numbers("random")
     assert result == []
+
+
+def test_extract_week_name():
+    assert extract_day_numbers("Week2Thursday") == [11]
+
+
+def test_iter_day_numbers_flattens():
+    assert list(iter_day_numbers([1, "Week2Monday", "random", 12])) == [1, 8, 12]
+
+
+# --- insert_schedule_records ---
+
+def test_insert_schedule_records_copies_rows(monkeypatch):
+    course = Course.from_row(("COEN", "311", "AA", "TuTh", "11:45", "13:00",
+                              "1", "1", "165", "1", "1", "50"))
+    course.tutorial[0].day, course.tutorial[0].start, course.tutorial[0].end = [5], 540, 590
+    course.lab[0].day, course.lab[0].start, course.lab[0].end = [1, 8], 840, 1005
+
+    conn = MagicMock()
+    monkeypatch.setattr(db_timetable_export, "get_connection", lambda: conn)
+
+    assert insert_schedule_records([course], {("COEN", "311"): ("H", "801")}, "2252") == 3
+    conn.commit.assert_called_once()
+    sql, buffer = conn.cursor.return_value.copy_expert.call_args.args
+    assert "FROM STDIN" in sql
+    assert buffer.getvalue().splitlines() == [
+        "COEN,311,AA,TUT,2252,AA,,,09:00:00,09:50:00,False,False,False,False,True,False,False",
+        "COEN,311,AA,LAB,2252,AA,H,801,14:00:00,16:45:00,True,False,False,False,False,False,False",
+        "COEN,311,AA,LAB,2252,AA,H,801,14:00:00,16:45:00,True,False,False,False,False,False,False",
+    ]
@@ -6,6 +6,8 @@ from fitness import (
     times_overlap,
     count_lecture_conflicts,
     get_course_by_code,
+    build_course_index,
+    split_course_code,
     has_valid_sequence_combination,
     fitness_function,
     evaluate_population,
@@ -73,6 +75,38 @@ def test_times_overlap_none_element():
     assert times_overlap(None, e1) is False
 
 
+def test_times_overlap_after_day_reassigned():
+    e1 = CourseElement(day=[1], start=525, end=690)
+    e2 = CourseElement(day=[2], start=600, end=765)
+    assert times_overlap(e1, e2) is False
+    e2.day = [1, 8]
+    assert times_overlap(e1, e2) is True
+
+
+def test_times_overlap_after_day_edited_in_place():
+    e1 = CourseElement(day=[1], start=525, end=600)
+    assert times_overlap(e1, CourseElement(day=[2], start=525, end=600)) is False
+    e1.day.append(2)
+    assert times_overlap(e1, CourseElement(day=[2], start=525, end=600)) is True
+
+
+def test_times_overlap_enum_days_do_not_match_ints():
+    lecture = CourseElement(day=(Day.MO,), start=525, end=690)
+    tut = CourseElement(day=[1], start=600, end=650)
+    assert times_overlap(lecture, tut) is False
+    assert times_overlap(lecture, CourseElement(day=(Day.MO,), start=600, end=650)) is True
+
+
+def test_times_overlap_shared_by_ga_modules():
+    import initialization, mutation, recombination, sequence_validation
+    from helper import conflict_export
+
+    for module in (initialization, mutation, recombination, sequence_validation):
+        assert module.times_overlap is times_overlap
+    # helper imports fitness as genetic_algo.fitness, a second module object for the same file.
+    assert conflict_export.times_overlap.__code__.co_filename == times_overlap.__code__.co_filename
+
+
 # --- count_lecture_conflicts ---
 
 def test_no_lecture_conflicts():
@@ -124,6 +158,20 @@ def test_get_course_not_found():
     assert get_course_by_code(schedule, "COEN212") is None
 
 
+# --- build_course_index / split_course_code ---
+
+def test_split_course_code():
+    assert split_course_code("ENGR290") == ("ENGR", "290")
+
+
+def test_course_index_keeps_first_section():
+    first = _make_course(subject="COEN", catalog="311")
+    second = _make_course(subject="COEN", catalog="311")
+    index = build_course_index([first, second])
+    assert index[("COEN", "311")] is first
+    assert index[("COEN", "311")] is get_course_by_code([first, second], "COEN311")
+
+
 # --- fitness_function ---
 
 def test_fitness_no_conflicts():
@@ -211,6 +259,14 @@ def test_sequence_combo_tut_lab_overlap():
     assert has_valid_sequence_combination([c1, c2], ["COEN212", "COEN231"]) is False
 
 
+def test_sequence_combo_backtracks_to_second_section():
+    c1 = _make_course(subject="COEN", catalog="212", tut_count=2, tut_duration=50)
+    c2 = _make_course(subject="COEN", catalog="231", tut_count=1, tut_duration=50)
+    for tut, (day, start) in zip(c1.tutorial + c2.tutorial, ((1, 525), (3, 525), (1, 525))):
+        tut.day, tut.start, tut.end = [day], start, start + 50
+    assert has_valid_sequence_combination([c1, c2], ["COEN212", "COEN231"]) is True
+
+
 # --- count_sequence_conflicts ---
 
 def test_sequence_conflicts_missing_course():
@@ -7,6 +7,7 @@ from room_management import RoomAssignment
 from initialization import (
     get_lab_days_for_frequency,
     check_room_conflict,
+    index_room_timetable_by_day,
     times_overlap,
     has_valid_lab_tut_combination,
     find_conflict_free_lab_slot,
@@ -14,6 +15,8 @@ from initialization import (
     insert_lab_into_timetable,
     initialize_course_with_validation,
     build_room_timetable_for_schedule,
+    valid_starts,
+    iter_shuffled,
 )
 
 
@@ -71,6 +74,14 @@ def test_room_conflict_different_day():
     assert check_room_conflict(2, 525, 690, timetable) is False
 
 
+def test_index_room_timetable_by_day():
+    timetable = {
+        ("H", "929"): [{"day": 1, "start": 525, "end": 690}, {"day": 8, "start": 525, "end": 690}],
+        ("H", "930"): [{"day": 1, "start": 705, "end": 870}],
+    }
+    assert index_room_timetable_by_day(timetable) == {1: [(525, 690), (705, 870)], 8: [(525, 690)]}
+
+
 # --- times_overlap ---
 
 def test_times_overlap_true():
@@ -169,6 +180,23 @@ def test_insert_tut_sets_day_and_time():
     assert course.tutorial[0].end - course.tutorial[0].start == 50
 
 
+def test_valid_starts_excludes_lecture_overlap():
+    # Lecture 11:45-13:00; 10:40 ends at 11:30 and 13:40 starts after.
+    assert valid_starts(50, 705, 780) == (525, 640, 820, 885, 1000, 1065, 1180)
+    assert valid_starts(165, 0, 1440) == ()
+
+
+def test_insert_tut_avoids_lecture_on_shared_day():
+    course = _make_course(
+        lecture_days=(Day.MO, Day.TU, Day.WE, Day.TH, Day.FR), lec_start=705, lec_end=780,
+        tut_count=1, weekly_tut_freq=1, tut_duration=100,
+    )
+    for seed in range(20):
+        random.seed(seed)
+        insert_tut_into_timetable(course)
+        assert course.tutorial[0].end <= 705 or course.tutorial[0].start >= 780
+
+
 # --- insert_lab_into_timetable (loop termination) ---
 
 def test_insert_lab_terminates():
@@ -256,6 +284,28 @@ def test_find_slot_with_room_conflict():
     assert result is None
 
 
+def test_find_slot_finds_only_free_slot():
+    course = _make_course(
+        lecture_days=(Day.MO,), lec_start=0, lec_end=1,
+        lab_count=1, biweekly_lab_freq=1, lab_duration=165,
+    )
+    # Book every slot except Week 2 Friday 14:45.
+    room_timetable = {("H", "929"): [
+        {"day": d, "start": 0, "end": 1440} for d in range(1, 12)
+    ] + [{"day": 12, "start": 0, "end": 885}, {"day": 12, "start": 1050, "end": 1440}]}
+    for seed in range(5):
+        random.seed(seed)
+        assert find_conflict_free_lab_slot(course, 0, room_timetable) == ([12], 885, 1050)
+
+
+def test_iter_shuffled_is_permutation():
+    random.seed(3)
+    items = list(range(40))
+    shuffled = list(iter_shuffled(items))
+    assert sorted(shuffled) == items
+    assert items == list(range(40))
+
+
 # --- initialize_course_with_validation ---
 
 def test_initialize_course_with_validation_simple():
@@ -337,3 +387,21 @@ def test_initialize_with_room_assignments():
         course, max_attempts=50, room_assignments=assignments, existing_schedule=[]
     )
     assert result is True
+
+
+def test_initialize_with_shared_room_timetable_matches_rebuild():
+    random.seed(7)
+    assignments = [RoomAssignment(bldg="H", room="929", subject="COEN", catalog_nbrs=["311", "312"])]
+    schedule = []
+    room_timetable = {}
+    for catalog in ("311", "312"):
+        course = _make_course(
+            catalog=catalog, lecture_days=(Day.MO,), lec_start=705, lec_end=780,
+            lab_count=2, biweekly_lab_freq=2, lab_duration=165,
+        )
+        assert initialize_course_with_validation(
+            course, max_attempts=50, room_assignments=assignments, room_timetable=room_timetable
+        ) is True
+        schedule.append(course)
+    assert room_timetable == build_room_timetable_for_schedule(schedule, assignments)
+    assert len(room_timetable[("H", "929")]) == 8
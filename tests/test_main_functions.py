@@ -83,6 +83,26 @@ def test_read_csv_empty_file(tmp_path):
     assert len(courses) == 0
 
 
+def test_read_csv_missing_header_raises(tmp_path):
+    csv_path = tmp_path / "Data.csv"
+    csv_path.write_text("subject,catalog_nbr\nCOEN,311\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        read_courses_from_csv(str(csv_path))
+
+
+def test_read_csv_skips_filtered_rows_before_parsing(tmp_path):
+    csv_path = str(tmp_path / "Data.csv")
+    _write_data_csv(csv_path, [_sample_row(), _sample_row(subject="MATH", catalog="201", start="bad")])
+    assert [c.subject for c in read_courses_from_csv(csv_path)] == ["COEN"]
+
+
+def test_read_csv_bad_row_reports_line(tmp_path):
+    csv_path = str(tmp_path / "Data.csv")
+    _write_data_csv(csv_path, [_sample_row(), _sample_row(catalog="212", start="bad")])
+    with pytest.raises(ValueError, match="line 3"):
+        read_courses_from_csv(csv_path)
+
+
 def test_read_csv_with_labs(tmp_path):
     csv_path = str(tmp_path / "Data.csv")
     row = _sample_row()
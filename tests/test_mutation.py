@@ -110,6 +110,21 @@ def test_reschedule_returns_course():
     assert result.tutorial[0].end > 0
 
 
+def test_reschedule_keeps_missing_lab():
+    random.seed(42)
+    c = _make_course(
+        lecture_days=(Day.MO,), lec_start=705, lec_end=780,
+        tut_count=1, weekly_tut_freq=1, tut_duration=50,
+    )
+    c = Course(subject=c.subject, catalog_nbr=c.catalog_nbr, class_nbr=c.class_nbr,
+               lecture=c.lecture, lab=(None,), tutorial=c.tutorial,
+               tut_count=1, weekly_tut_freq=1, tut_duration=50)
+    result = reschedule_course_safely(c, max_attempts=50)
+    assert result is not c
+    assert result.lab == (None,)
+    assert result.tutorial[0].end > 0
+
+
 # --- mutate ---
 
 def test_mutate_non_core_course():
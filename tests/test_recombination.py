@@ -125,6 +125,19 @@ def test_crossover_preserves_length():
     assert len(offspring) == 2
 
 
+def test_crossover_copies_missing_elements():
+    random.seed(42)
+    parents = [
+        [Course(subject="COEN", catalog_nbr="390", class_nbr="00001", lecture=None,
+                lab=(None,), tutorial=(None,))]
+        for _ in range(2)
+    ]
+    offspring = uniform_crossover(parents[0], parents[1], core_sequences=[])
+    assert offspring[0] is not parents[0][0] and offspring[0] is not parents[1][0]
+    assert offspring[0].lecture is None
+    assert offspring[0].lab == (None,) and offspring[0].tutorial == (None,)
+
+
 def test_crossover_mismatched_raises():
     c1 = _make_course(subject="COEN", catalog="212")
     c2 = _make_course(subject="COEN", catalog="311")
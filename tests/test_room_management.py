@@ -12,6 +12,8 @@ from room_management import (
     create_room_timetables,
     count_room_conflicts,
     load_room_assignments,
+    build_room_lookup,
+    lookup_room_for_course,
 )
 
 
@@ -108,6 +110,34 @@ def test_find_room_not_found():
     assert result is None
 
 
+# --- build_room_lookup ---
+
+def test_build_room_lookup_first_assignment_wins():
+    assignments = [
+        RoomAssignment(bldg="H", room="929", subject=" coen ", catalog_nbrs=["311", "212"]),
+        RoomAssignment(bldg="H", room="801", subject="COEN", catalog_nbrs=["311"]),
+    ]
+    lookup = build_room_lookup(assignments)
+    assert lookup == {("COEN", "311"): ("H", "929"), ("COEN", "212"): ("H", "929")}
+
+
+def test_build_room_lookup_dict_passthrough():
+    rooms = {("COEN", "311"): ("H", "929")}
+    assert build_room_lookup(rooms) is rooms
+    assert build_room_lookup(None) == {}
+
+
+def test_lookup_room_matches_find_room():
+    assignments = [
+        RoomAssignment(bldg="H", room="929", subject=" coen ", catalog_nbrs=["311"]),
+        RoomAssignment(bldg="H", room="801", subject="COEN", catalog_nbrs=["311", "212"]),
+    ]
+    lookup = build_room_lookup(assignments)
+    for course in (_make_course(catalog="311"), _make_course(subject="coen", catalog="212"),
+                   _make_course(catalog="490")):
+        assert lookup_room_for_course(course, lookup) == find_room_for_course(course, assignments)
+
+
 # --- validate_room_timetables ---
 
 def test_validate_no_conflicts():
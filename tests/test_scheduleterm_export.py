@@ -1,4 +1,5 @@
 import pytest
+from unittest.mock import MagicMock
 from helper.scheduleterm_export import (
     should_exclude_course,
     build_termcode,
@@ -9,7 +10,9 @@ from helper.scheduleterm_export import (
     combine_day_columns,
     extract_day_numbers,
     get_previous_year_data,
+    insert_lecture_records,
 )
+import helper.scheduleterm_export as scheduleterm_export
 from day import Day
 
 
@@ -209,3 +212,34 @@ def test_prev_year_not_found():
     result = get_previous_year_data('COEN', '311', 'AA', 'TUT', {})
     assert result['classnumber'] is None
     assert result['session'] == '13W'
+
+
+# --- insert_lecture_records ---
+
+def _lecture(subject, catalog):
+    row = dict.fromkeys((
+        'section', 'classnumber', 'buildingcode', 'room', 'instructionmodecode', 'locationcode',
+        'currentwaitlisttotal', 'waitlistcapacity', 'enrollmentcapacity', 'currentenrollment',
+        'departmentcode', 'facultycode', 'classstarttime', 'classendtime',
+        'mondays', 'tuesdays', 'wednesdays', 'thursdays', 'fridays', 'saturdays', 'sundays',
+        'facultydescription', 'career',
+    ))
+    row.update(subject=subject, catalog=catalog)
+    return row
+
+
+def test_insert_lecture_records_batches_rows(monkeypatch):
+    conn = MagicMock()
+    execute_batch = MagicMock()
+    monkeypatch.setattr(scheduleterm_export, "get_connection", lambda: conn)
+    monkeypatch.setattr(scheduleterm_export, "fetch_all",
+                        lambda sql, params=None: [_lecture('COEN', '311'), _lecture('ELEC', '430')])
+    monkeypatch.setattr(scheduleterm_export, "execute_batch", execute_batch)
+
+    assert insert_lecture_records("2262", 2, "2252") == 1
+    conn.commit.assert_called_once()
+    cur, sql, rows = execute_batch.call_args.args
+    assert cur is conn.cursor.return_value
+    assert sql.count("%s") == 31
+    assert len(rows) == 1 and len(rows[0]) == 31
+    assert rows[0][:5] == ('COEN', '311', None, 'LEC', '2262')
@@ -34,6 +34,13 @@ def test_fitness_ratio_empty():
     assert terminate is False
 
 
+def test_fitness_ratio_uses_given_max():
+    scores = [0.95, 0.96, 0.97, 0.98]
+    assert check_fitness_ratio(scores, 0.9, max_fitness=0.98) == check_fitness_ratio(scores, 0.9)
+    terminate, _ = check_fitness_ratio(scores, 0.9, max_fitness=2.0)
+    assert terminate is False
+
+
 def test_fitness_ratio_all_negative():
     terminate, _ = check_fitness_ratio([-5.0, -3.0, -1.0], 0.9)
     assert terminate is False
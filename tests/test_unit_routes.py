@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from app import ROUTE_TEMPLATES
+from app import ROUTE_TEMPLATES, ROUTE_TEMPLATE_KEYS
 
 
 EXPECTED_GET_ROUTES = {
@@ -15,7 +15,6 @@ EXPECTED_GET_ROUTES = {
     "/api/filters",
     "/api/plans/<int:planid>/terms",
     "/api/export-csv",
-    "/api/import/labrooms",
 }
 
 EXPECTED_POST_ROUTES = {
@@ -23,20 +22,23 @@ EXPECTED_POST_ROUTES = {
     "/api/import/labrooms",
 }
 
+# ROUTE_TEMPLATES lists /schedule, but that page has no route or template yet.
+UNIMPLEMENTED_PAGE_ROUTES = {"/schedule"}
 
-def test_routes_are_registered(app):
-    rules = {r.rule for r in app.url_map.iter_rules()}
 
-    missing_get = EXPECTED_GET_ROUTES - rules
-    missing_post = EXPECTED_POST_ROUTES - rules
+def test_routes_are_registered(app_rules_by_method, rule_map):
+    missing_get = EXPECTED_GET_ROUTES - app_rules_by_method["GET"]
+    missing_post = EXPECTED_POST_ROUTES - app_rules_by_method["POST"]
+    missing_pages = ROUTE_TEMPLATE_KEYS - UNIMPLEMENTED_PAGE_ROUTES - rule_map.keys()
 
     assert not missing_get, f"Missing GET routes: {sorted(missing_get)}"
     assert not missing_post, f"Missing POST routes: {sorted(missing_post)}"
+    assert not missing_pages, f"Missing page routes: {sorted(missing_pages)}"
 
 
-def test_schedulerrun_is_post(app):
+def test_schedulerrun_is_post(rule_map):
     """Ensure /schedulerrun is registered as POST (not only GET)."""
-    rule = next((r for r in app.url_map.iter_rules() if r.rule == "/schedulerrun"), None)
+    rule = rule_map.get("/schedulerrun")
     assert rule is not None, "Route /schedulerrun is not registered"
     assert "POST" in rule.methods, f"/schedulerrun should allow POST, got {rule.methods}"
 
@@ -1,10 +1,24 @@
 # course.py
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Tuple, List
-from day import parse_day_pattern
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from typing import Callable, Iterator, Optional, Sequence, Tuple
+from day import Day, parse_day_pattern
 from course_element import CourseElement
+import csv
 import re
+import sys
+
+_TIME_RE = re.compile(r"(\d{1,2}):(\d{2})(?::(\d{2}))?")
+
+CSV_FIELDS: Tuple[str, ...] = (
+    "subject", "catalog_nbr", "class_nbr", "day_of_week", "start_time", "end_time",
+    "lab_count", "biweekly_lab_freq", "lab_duration",
+    "tut_count", "weekly_tut_freq", "tut_duration",
+)
+
 
 def parse_time_to_minutes(raw: str) -> int:
     """Parse time formats: '11:45', '11:45:00', '11.45.00', '13.00.00'."""
@@ -14,7 +28,13 @@ def parse_time_to_minutes(raw: str) -> int:
 
     s = s.replace(".", ":")
 
-    m = re.fullmatch(r"(\d{1,2}):(\d{2})(?::(\d{2}))?", s)
+    # Fast path for the fixed-width 'HH:MM' / 'HH:MM:SS' shapes the CSV uses.
+    if len(s) in (5, 8) and s[2] == ":" and (len(s) == 5 or s[5] == ":"):
+        hh, mm, ss = s[:2], s[3:5], s[6:] or "0"
+        if hh.isdecimal() and mm.isdecimal() and ss.isdecimal():
+            return _to_minutes(raw, int(hh), int(mm), int(ss))
+
+    m = _TIME_RE.fullmatch(s)
     if not m:
         raise ValueError(f"Invalid time format '{raw}'")
 
@@ -22,6 +42,10 @@ def parse_time_to_minutes(raw: str) -> int:
     mm = int(m.group(2))
     ss = int(m.group(3)) if m.group(3) else 0
 
+    return _to_minutes(raw, hh, mm, ss)
+
+
+def _to_minutes(raw: str, hh: int, mm: int, ss: int) -> int:
     if not (0 <= hh <= 23 and 0 <= mm <= 59 and 0 <= ss <= 59):
         raise ValueError(f"Time out of range '{raw}'")
 
@@ -39,6 +63,44 @@ def _int_or_zero(s: str) -> int:
     return int(s) if s else 0
 
 
+@lru_cache(maxsize=None)
+def _lecture_day_codes(days: Tuple[Day, ...]) -> Tuple[int, ...]:
+    return tuple(chain.from_iterable(d.value for d in days))
+
+
+def _day_codes_to_mask(codes) -> int:
+    mask = 0
+    for code in codes:
+        mask |= 1 << code
+    return mask
+
+
+@lru_cache(maxsize=None)
+def _lecture_day_mask(days: Tuple[Day, ...]) -> int:
+    return _day_codes_to_mask(_lecture_day_codes(days))
+
+
+def _placeholder_elements(count: int) -> Tuple[CourseElement, ...]:
+    """Unscheduled elements; not a shared singleton, since initialization fills each one in place."""
+    return tuple(
+        CourseElement(day=[], start=0, end=0, bldg=None, room=None)
+        for _ in range(count)
+    )
+
+
+def _clone_element(element: Optional[CourseElement]) -> Optional[CourseElement]:
+    return element.clone() if element is not None else None
+
+
+def csv_field_getter(header: Sequence[str]) -> Callable[[Sequence[str]], tuple]:
+    """Validate a Data.csv header once and return a getter yielding CSV_FIELDS in order."""
+    positions = {name: i for i, name in enumerate(header)}
+    for key in CSV_FIELDS:
+        if key not in positions:
+            raise KeyError(f"Missing CSV header '{key}'")
+    return itemgetter(*(positions[key] for key in CSV_FIELDS))
+
+
 @dataclass(frozen=True, slots=True)
 class Course:
     subject: str
@@ -58,22 +120,93 @@ class Course:
     tut_duration: int = 0
 
     @property
-    def day_codes(self) -> List[int]:
-        """Get day codes from lecture (e.g., TuTh -> [2, 9, 4, 11])."""
-        codes: List[int] = []
-        for d in self.lecture.day:
-            codes.extend(d.as_list())
-        return codes
+    def day_codes(self) -> Tuple[int, ...]:
+        """Get day codes from lecture (e.g., TuTh -> (2, 9, 4, 11))."""
+        days = self.lecture.day
+        if isinstance(days, tuple):
+            return _lecture_day_codes(days)
+        return tuple(chain.from_iterable(d.value for d in days))
+
+    @property
+    def day_mask(self) -> int:
+        """Lecture day codes as a bitmask (bit n set for day n), for overlap checks via '&'."""
+        days = self.lecture.day
+        if isinstance(days, tuple):
+            return _lecture_day_mask(days)
+        return _day_codes_to_mask(chain.from_iterable(d.value for d in days))
+
+    def clone(self) -> Course:
+        """Copy for a new individual: fresh lecture/lab/tutorial elements (None stays None), shared immutable fields."""
+        return Course(
+            self.subject, self.catalog_nbr, self.class_nbr,
+            _clone_element(self.lecture),
+            tuple(_clone_element(lab) for lab in self.lab),
+            tuple(_clone_element(tut) for tut in self.tutorial),
+            self.lab_count, self.biweekly_lab_freq, self.lab_duration,
+            self.tut_count, self.weekly_tut_freq, self.tut_duration,
+        )
+
+    @classmethod
+    def bulk_from_csv(cls, path: str,
+                      include: Optional[Callable[[str, str], bool]] = None) -> list[Course]:
+        """Load a Data.csv file, resolving the header once for all rows (include as in stream_from_csv)."""
+        return list(chain.from_iterable(cls.stream_from_csv(path, include=include)))
+
+    @classmethod
+    def stream_from_csv(cls, path: str, chunksize: int = 10_000,
+                        include: Optional[Callable[[str, str], bool]] = None) -> Iterator[list[Course]]:
+        """Yield courses from a Data.csv file in lists of at most chunksize.
+
+        include(subject, catalog_nbr) is checked on the raw values, so skipped rows
+        never become Course objects. A bad header or row raises ValueError naming the line.
+        """
+        with open(path, "r", newline="", encoding="utf-8-sig") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return
+            try:
+                get_fields = csv_field_getter(header)
+            except KeyError as e:
+                raise ValueError(f"Error parsing CSV header: {e}") from e
+            from_row = cls.from_row
+            chunk = []
+            for row in reader:
+                if not row:
+                    continue
+                try:
+                    values = get_fields(row)
+                    if include is not None and not include(values[0], values[1]):
+                        continue
+                    chunk.append(from_row(values))
+                except Exception as e:
+                    raise ValueError(
+                        f"Error parsing CSV at line {reader.line_num}: {e}\nRow={dict(zip(header, row))}"
+                    ) from e
+                if len(chunk) >= chunksize:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
 
     @classmethod
     def from_csv_row(cls, row: dict) -> "Course":
-        subject = _get(row, "subject")
-        catalog_nbr = _get(row, "catalog_nbr")
-        class_nbr = _get(row, "class_nbr")
+        return cls.from_row(tuple(_get(row, key) for key in CSV_FIELDS))
+
+    @classmethod
+    def from_row(cls, values: Sequence[str]) -> "Course":
+        """Build a Course from raw CSV values ordered as CSV_FIELDS."""
+        (subject, catalog_nbr, class_nbr, day_of_week, start_time, end_time,
+         lab_count, biweekly_lab_freq, lab_duration,
+         tut_count, weekly_tut_freq, tut_duration) = values
+
+        subject = sys.intern(subject.strip().upper())
+        catalog_nbr = sys.intern(catalog_nbr.strip())
+        class_nbr = class_nbr.strip()
 
-        lec_days = parse_day_pattern(_get(row, "day_of_week"))
-        lec_start = parse_time_to_minutes(_get(row, "start_time"))
-        lec_end = parse_time_to_minutes(_get(row, "end_time"))
+        lec_days = parse_day_pattern(day_of_week)
+        lec_start = parse_time_to_minutes(start_time)
+        lec_end = parse_time_to_minutes(end_time)
 
         lecture = CourseElement(
             day=lec_days,
@@ -83,23 +216,16 @@ class Course:
             room=None
         )
 
-        lab_count = _int_or_zero(_get(row, "lab_count"))
-        biweekly_lab_freq = _int_or_zero(_get(row, "biweekly_lab_freq"))
-        lab_duration = _int_or_zero(_get(row, "lab_duration"))
+        lab_count = _int_or_zero(lab_count)
+        biweekly_lab_freq = _int_or_zero(biweekly_lab_freq)
+        lab_duration = _int_or_zero(lab_duration)
 
-        tut_count = _int_or_zero(_get(row, "tut_count"))
-        weekly_tut_freq = _int_or_zero(_get(row, "weekly_tut_freq"))
-        tut_duration = _int_or_zero(_get(row, "tut_duration"))
+        tut_count = _int_or_zero(tut_count)
+        weekly_tut_freq = _int_or_zero(weekly_tut_freq)
+        tut_duration = _int_or_zero(tut_duration)
 
-        laboratory = tuple(
-            CourseElement(day=[], start=0, end=0, bldg=None, room=None) 
-            for _ in range(lab_count)
-        )
-
-        tutorials = tuple(
-            CourseElement(day=[], start=0, end=0, bldg=None, room=None) 
-            for _ in range(tut_count)
-        )
+        laboratory = _placeholder_elements(lab_count)
+        tutorials = _placeholder_elements(tut_count)
 
         return cls(
             subject=subject,
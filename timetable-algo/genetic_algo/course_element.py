@@ -2,7 +2,7 @@
 from dataclasses import dataclass
 from typing import List, Optional
 
-@dataclass
+@dataclass(slots=True)
 class CourseElement:
     """Represents a course component (lecture, lab, or tutorial)."""
     day: List[int]  # Day numbers (1-5 for Week 1, 8-12 for Week 2)
@@ -10,3 +10,10 @@ class CourseElement:
     end: int  # End time in minutes from midnight
     bldg: Optional[str] = None
     room: Optional[str] = None
+
+    def clone(self) -> "CourseElement":
+        """Independent copy: day lists are copied, tuples are shared."""
+        day = self.day
+        if isinstance(day, list):
+            day = day.copy()
+        return CourseElement(day, self.start, self.end, self.bldg, self.room)
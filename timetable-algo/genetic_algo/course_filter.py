@@ -1,33 +1,57 @@
 # course_filter.py
-EXCLUDED_ELEC_COURSES = {'430', '434', '436', '438', '443', '446', '498'}
+import sys
+from operator import itemgetter
 
+EXCLUDED_ELEC_COURSES = frozenset(map(sys.intern, ('430', '434', '436', '438', '443', '446', '498')))
 
-def should_include_course(subject: str, catalog: str) -> bool:
-    """Determine if a course should be included in scheduling (COEN, ELEC except excluded, ENGR 290)."""
-    subject = subject.upper().strip()
-    catalog = catalog.strip()
-    
-    if subject == "COEN":
-        return True
-    
-    if subject == "ELEC":
-        return catalog not in EXCLUDED_ELEC_COURSES
-    
-    if subject == "ENGR" and catalog == "290":
+_INCLUDED_SUBJECTS = ("COEN", "ELEC")
+
+# Subjects scheduled only for the listed catalogs.
+PARTIAL_SUBJECT_CATALOGS = {"ENGR": frozenset({"290"})}
+
+_SUBJECT_RULES = {
+    "COEN": lambda catalog: True,
+    "ELEC": lambda catalog: catalog not in EXCLUDED_ELEC_COURSES,
+    "ENGR": lambda catalog: catalog in PARTIAL_SUBJECT_CATALOGS["ENGR"],
+}
+
+
+def should_include_course(subject: str, catalog: str, filter_excluded_elec: bool = True) -> bool:
+    """Determine if a course should be included in scheduling (COEN, ELEC except excluded, ENGR 290).
+
+    With filter_excluded_elec=False every ELEC course is kept (used for room and sequence data).
+    """
+    return should_include_course_canon(subject.upper().strip(), catalog.strip(), filter_excluded_elec)
+
+
+def should_include_course_all_elec(subject: str, catalog: str) -> bool:
+    """should_include_course keeping every ELEC course (room, sequence and pre-filtered CSV data)."""
+    return should_include_course(subject, catalog, filter_excluded_elec=False)
+
+
+def should_include_course_canon(subject: str, catalog: str, filter_excluded_elec: bool = True) -> bool:
+    """Same as should_include_course for an already upper-cased, stripped subject and catalog."""
+    if not filter_excluded_elec and subject == "ELEC":
         return True
-    
-    return False
+    rule = _SUBJECT_RULES.get(subject)
+    return rule is not None and rule(catalog)
+
 
+def get_included_subjects() -> tuple:
+    """Get the fully included subjects."""
+    return _INCLUDED_SUBJECTS
 
-def get_included_subjects() -> list:
-    """Get list of fully included subjects."""
-    return ["COEN", "ELEC"]
+
+def get_partial_course_codes() -> list:
+    """Get "SUBJECT CATALOG" codes of the partially included courses (e.g. "ENGR 290")."""
+    return [f"{subject} {catalog}" for subject, catalogs in sorted(PARTIAL_SUBJECT_CATALOGS.items())
+            for catalog in sorted(catalogs)]
 
 
 def get_partial_subjects() -> dict:
     """Get dictionary of partially included subjects with their rules."""
     return {
-        "ENGR": ["290"],
+        "ENGR": sorted(PARTIAL_SUBJECT_CATALOGS["ENGR"]),
         "ELEC": f"All except {', '.join(sorted(EXCLUDED_ELEC_COURSES))}"
     }
 
@@ -40,17 +64,20 @@ def display_filter_info():
 def filter_course_list(courses: list, subject_field: str = 'subject', 
                        catalog_field: str = 'catalog') -> tuple:
     """Filter a list of course dictionaries."""
+    get_fields = itemgetter(subject_field, catalog_field)
+    include = should_include_course_canon
     filtered_courses = []
-    filtered_count = 0
-    
+    append = filtered_courses.append
+
     for course in courses:
-        subject = course.get(subject_field, '')
-        catalog = course.get(catalog_field, '')
-        
-        if should_include_course(subject, catalog):
-            filtered_courses.append(course)
-        else:
-            filtered_count += 1
+        try:
+            subject, catalog = get_fields(course)
+        except KeyError:
+            subject, catalog = course.get(subject_field, ''), course.get(catalog_field, '')
+        if include(subject.upper().strip(), catalog.strip()):
+            append(course)
+
+    filtered_count = len(courses) - len(filtered_courses)
     
     return filtered_courses, filtered_count
 
@@ -1,8 +1,8 @@
 # day.py
 from __future__ import annotations
 from enum import Enum
+from functools import lru_cache
 from typing import Tuple, List
-import re
 
 class Day(Enum):
     MO = (1, 8)
@@ -25,19 +25,23 @@ class Day(Enum):
         return list(self.value)
 
 
+# Separators stripped from day patterns before tokenizing ("Mo, We" -> "MoWe").
+_SEPARATOR_TABLE = str.maketrans("", "", " \t\n\r\f\v,/;-")
+
 _DAY_TOKEN_TO_ENUM = {
     "Mo": Day.MO, "Tu": Day.TU, "We": Day.WE, "Th": Day.TH,
     "Fr": Day.FR, "Sa": Day.SA, "Su": Day.SU,
 }
 
 
+@lru_cache(maxsize=256)
 def parse_day_pattern(raw: str) -> Tuple[Day, ...]:
     """Parse day patterns like 'MoWe' -> (Day.MO, Day.WE), 'TuTh' -> (Day.TU, Day.TH)."""
     s = (raw or "").strip()
     if not s:
         raise ValueError("day_of_week is empty")
 
-    s = re.sub(r"[\s,/;-]+", "", s)
+    s = s.translate(_SEPARATOR_TABLE)
 
     days: list[Day] = []
     i = 0
@@ -1,5 +1,5 @@
 # fitness.py
-from itertools import product
+from functools import lru_cache
 
 def calculate_variety_score(elements):
     """Calculate variety score for course elements (0-1, higher = more variety)."""
@@ -14,14 +14,16 @@ def calculate_variety_score(elements):
     n = len(valid_elements)
     
     unique_days = set()
+    unique_starts = set()
+    total_days = 0
     for element in valid_elements:
-        unique_days.update(element.day)
+        days = element.day
+        unique_days.update(days)
+        total_days += len(days)
+        unique_starts.add(element.start)
     
-    total_days = sum(len(element.day) for element in valid_elements)
     day_variety = len(unique_days) / total_days if total_days > 0 else 0
-    
-    unique_times = len(set(element.start for element in valid_elements))
-    time_variety = unique_times / n
+    time_variety = len(unique_starts) / n
     
     variety_score = 0.5 * day_variety + 0.5 * time_variety
     
@@ -33,10 +35,7 @@ def times_overlap(element1, element2):
     if element1 is None or element2 is None:
         return False
     
-    days1 = set(element1.day)
-    days2 = set(element2.day)
-    
-    if not days1.intersection(days2):
+    if set(element1.day).isdisjoint(element2.day):
         return False
     
     return element1.start < element2.end and element2.start < element1.end
@@ -62,10 +61,25 @@ def count_lecture_conflicts(course):
     return conflicts
 
 
-def get_course_by_code(schedule, course_code, class_nbr=None):
-    """Find a course in the schedule by subject+catalog_nbr and optionally class_nbr."""
+@lru_cache(maxsize=1024)
+def split_course_code(course_code):
+    """Split a course code like 'COEN212' into ('COEN', '212')."""
     subject = ''.join(c for c in course_code if c.isalpha())
     catalog = ''.join(c for c in course_code if c.isdigit())
+    return subject, catalog
+
+
+def build_course_index(schedule):
+    """Index a schedule by (subject, catalog_nbr), keeping the first course like get_course_by_code."""
+    index = {}
+    for course in schedule:
+        index.setdefault((course.subject, course.catalog_nbr), course)
+    return index
+
+
+def get_course_by_code(schedule, course_code, class_nbr=None):
+    """Find a course in the schedule by subject+catalog_nbr and optionally class_nbr."""
+    subject, catalog = split_course_code(course_code)
     
     for course in schedule:
         if course.subject == subject and course.catalog_nbr == catalog:
@@ -74,72 +88,49 @@ def get_course_by_code(schedule, course_code, class_nbr=None):
     return None
 
 
-def has_valid_sequence_combination(schedule, sequence_courses):
+def has_valid_sequence_combination(schedule, sequence_courses, course_index=None):
     """Check if there's at least one valid combination of tutorials/labs without overlaps."""
+    if course_index is None:
+        course_index = build_course_index(schedule)
+    
     courses = []
     for course_code in sequence_courses:
-        course = get_course_by_code(schedule, course_code)
+        course = course_index.get(split_course_code(course_code))
         if course is None:
             return False
         courses.append(course)
     
-    all_tutorials = []
-    all_labs = []
+    # One group per course component; a valid combination picks one element from each.
+    groups = []
     
     for course in courses:
         if course.tutorial:
             valid_tuts = [t for t in course.tutorial if t is not None]
             if valid_tuts:
-                all_tutorials.append(valid_tuts)
+                groups.append(valid_tuts)
         
         if course.lab:
             valid_labs = [l for l in course.lab if l is not None]
             if valid_labs:
-                all_labs.append(valid_labs)
+                groups.append(valid_labs)
     
-    if not all_tutorials and not all_labs:
+    # Fewest choices first so conflicts prune the search as early as possible.
+    groups.sort(key=len)
+    return _has_disjoint_choice(groups, [])
+
+
+def _has_disjoint_choice(groups, chosen):
+    """Depth-first search for one element per group with no two overlapping."""
+    if len(chosen) == len(groups):
         return True
     
-    tut_combinations = list(product(*all_tutorials)) if all_tutorials else [[]]
-    lab_combinations = list(product(*all_labs)) if all_labs else [[]]
-    
-    for tut_combo in tut_combinations:
-        tut_has_overlap = False
-        for i, tut1 in enumerate(tut_combo):
-            for tut2 in tut_combo[i+1:]:
-                if times_overlap(tut1, tut2):
-                    tut_has_overlap = True
-                    break
-            if tut_has_overlap:
-                break
-        
-        if tut_has_overlap:
+    for candidate in groups[len(chosen)]:
+        if any(times_overlap(candidate, other) for other in chosen):
             continue
-        
-        for lab_combo in lab_combinations:
-            lab_has_overlap = False
-            for i, lab1 in enumerate(lab_combo):
-                for lab2 in lab_combo[i+1:]:
-                    if times_overlap(lab1, lab2):
-                        lab_has_overlap = True
-                        break
-                if lab_has_overlap:
-                    break
-            
-            if lab_has_overlap:
-                continue
-            
-            tut_lab_overlap = False
-            for tut in tut_combo:
-                for lab in lab_combo:
-                    if times_overlap(tut, lab):
-                        tut_lab_overlap = True
-                        break
-                if tut_lab_overlap:
-                    break
-            
-            if not tut_lab_overlap:
-                return True
+        chosen.append(candidate)
+        if _has_disjoint_choice(groups, chosen):
+            return True
+        chosen.pop()
     
     return False
 
@@ -147,9 +138,10 @@ def has_valid_sequence_combination(schedule, sequence_courses):
 def count_sequence_conflicts(schedule, core_sequences):
     """Count the number of semester sequences with no valid combination."""
     conflicts = 0
+    course_index = build_course_index(schedule)
     
     for semester_courses in core_sequences:
-        if not has_valid_sequence_combination(schedule, semester_courses):
+        if not has_valid_sequence_combination(schedule, semester_courses, course_index):
             conflicts += 1
     
     return conflicts
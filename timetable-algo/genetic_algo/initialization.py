@@ -1,6 +1,9 @@
 # initialization.py
 import random
+from functools import lru_cache
+from itertools import product
 from course import Course
+from fitness import times_overlap
 from typing import Tuple, List, Optional, Dict
 
 start_time_0845 = 8*60 + 45
@@ -24,42 +27,44 @@ tut_50_start = [start_time_0845, start_time_1040, start_time_1145, start_time_13
 tut_100_start = [start_time_0845, start_time_0950, start_time_1145, start_time_1250, 
                     start_time_1445, start_time_1550, start_time_1745, start_time_1850]
 
+_STARTS_BY_DURATION = {50: tut_50_start, 100: tut_100_start, 165: lab_165_start}
+
+
+@lru_cache(maxsize=None)
+def valid_starts(duration: int, lec_start: int, lec_end: int) -> Tuple[int, ...]:
+    """Start times for a session of this duration that do not overlap the lecture."""
+    return tuple(start for start in _STARTS_BY_DURATION[duration]
+                 if start + duration <= lec_start or start >= lec_end)
+
+
+def choose_start_avoiding_lecture(duration: int, lecture) -> int:
+    """Random start clear of the lecture; any start for the duration if none is clear."""
+    starts = valid_starts(duration, lecture.start, lecture.end)
+    return random.choice(starts or _STARTS_BY_DURATION[duration])
+
+
+# (weekly_tut_freq, tut_duration) -> start times; other combinations are left unscheduled.
+_TUT_STARTS = {(1, 50): tut_50_start, (1, 100): tut_100_start}
+
+# (biweekly_lab_freq, lab_duration) -> start times when no conflict-free lab slot is found.
+_FALLBACK_LAB_STARTS = {(1, 165): lab_165_start, (1, 100): tut_100_start}
+
+
 def insert_tut_into_timetable(course):
+    starts = _TUT_STARTS.get((course.weekly_tut_freq, course.tut_duration))
+    if starts is None:
+        return
+    duration = course.tut_duration
+    choice = random.choice
+    
     for tut in course.tutorial:
-        if course.weekly_tut_freq == 1 and course.tut_duration == 50:
-            d = random.choice(day_of_week_tut)
-            tut.day = [d, d + 7]
-            if any(d in day.value for day in course.lecture.day):
-                diff = -1
-                attempts = 0
-                while 0 >= diff and attempts < 120:
-                    tut_start = random.choice(tut_50_start)
-                    if tut_start > course.lecture.start:
-                        diff = tut_start - course.lecture.end
-                    elif course.lecture.start > tut_start:
-                        diff = course.lecture.end - 50 - tut_start
-                    attempts += 1
-                tut.start = tut_start
-            else:
-                tut.start = random.choice(tut_50_start)
-            tut.end = tut.start + 50
-        elif course.weekly_tut_freq == 1 and course.tut_duration == 100:
-            d = random.choice(day_of_week_tut)
-            tut.day = [d, d + 7]
-            if any(d in day.value for day in course.lecture.day):
-                diff = -1
-                attempts = 0
-                while 0 >= diff and attempts < 120:
-                    tut_start = random.choice(tut_100_start)
-                    if tut_start > course.lecture.start:
-                        diff = tut_start - course.lecture.end
-                    elif course.lecture.start > tut_start:
-                        diff = course.lecture.end - 100 - tut_start
-                    attempts += 1
-                tut.start = tut_start
-            else:
-                tut.start = random.choice(tut_100_start)    
-            tut.end = tut.start + 100
+        d = choice(day_of_week_tut)
+        tut.day = [d, d + 7]
+        if course.day_mask & (1 << d):
+            tut.start = choose_start_avoiding_lecture(duration, course.lecture)
+        else:
+            tut.start = choice(starts)
+        tut.end = tut.start + duration
 
 
 def get_lab_days_for_frequency(biweekly_lab_freq: int, base_day: int) -> List[int]:
@@ -75,6 +80,13 @@ def get_lab_days_for_frequency(biweekly_lab_freq: int, base_day: int) -> List[in
         return [base_day]
 
 
+# (biweekly_lab_freq, base_day) -> lab days, shared read-only across slot attempts.
+_LAB_DAYS = {
+    (freq, base_day): tuple(get_lab_days_for_frequency(freq, base_day))
+    for freq in (1, 2) for base_day in day_of_week_lab
+}
+
+
 def check_room_conflict(day: int, start: int, end: int, 
                         room_timetable: Optional[Dict] = None) -> bool:
     """Check if placing a lab creates a room conflict."""
@@ -90,41 +102,74 @@ def check_room_conflict(day: int, start: int, end: int,
     return False
 
 
+def index_room_timetable_by_day(room_timetable: Dict) -> Dict[int, List[Tuple[int, int]]]:
+    """Group the (start, end) of every booked slot in room_timetable by day."""
+    busy_by_day = {}
+    for slots in room_timetable.values():
+        for slot in slots:
+            busy_by_day.setdefault(slot['day'], []).append((slot['start'], slot['end']))
+    return busy_by_day
+
+
+# Every (base_day, start) a lab of the given duration can be tried at.
+_LAB_SLOTS_165 = tuple(product(day_of_week_lab, lab_165_start))
+_LAB_SLOTS_100 = tuple(product(day_of_week_lab, tut_100_start))
+
+
+def iter_shuffled(items):
+    """Yield items in uniformly random order, shuffling lazily as they are consumed."""
+    pool = list(items)
+    n = len(pool)
+    randrange = random.randrange
+    for i in range(n):
+        j = randrange(i, n)
+        pool[i], pool[j] = pool[j], pool[i]
+        yield pool[i]
+
+
 def find_conflict_free_lab_slot(course, lab_index: int, room_timetable: Optional[Dict] = None,
                                 max_attempts: int = 100) -> Optional[Tuple[List[int], int, int]]:
-    """Find a conflict-free slot for a lab."""
-    if course.lab_duration == 165:
-        available_starts = lab_165_start
-    elif course.lab_duration == 100:
-        available_starts = tut_100_start
+    """Find a conflict-free slot for a lab, trying each (day, start) at most once."""
+    if course.lab_duration == 100:
+        slots = _LAB_SLOTS_100
     else:
-        available_starts = lab_165_start
+        slots = _LAB_SLOTS_165
     
-    for attempt in range(max_attempts):
-        base_day = random.choice(day_of_week_lab)
-        lab_days = get_lab_days_for_frequency(course.biweekly_lab_freq, base_day)
-        lab_start = random.choice(available_starts)
-        lab_end = lab_start + course.lab_duration
+    busy_by_day = None
+    if room_timetable is not None:
+        busy_by_day = index_room_timetable_by_day(room_timetable)
+    
+    freq = course.biweekly_lab_freq
+    duration = course.lab_duration
+    lecture_mask = course.day_mask
+    lec_start = course.lecture.start
+    lec_end = course.lecture.end
+    
+    for attempt, (base_day, lab_start) in zip(range(max_attempts), iter_shuffled(slots)):
+        lab_days = (_LAB_DAYS.get((freq, base_day))
+                    or tuple(get_lab_days_for_frequency(freq, base_day)))
+        lab_end = lab_start + duration
         
         base_weekday = base_day if base_day <= 7 else base_day - 7
         has_lecture_conflict = False
         
-        if any(base_weekday in day.value for day in course.lecture.day):
-            if lab_start < course.lecture.end and course.lecture.start < lab_end:
+        if lecture_mask & (1 << base_weekday):
+            if lab_start < lec_end and lec_start < lab_end:
                 has_lecture_conflict = True
         
         if has_lecture_conflict:
             continue
         
         has_room_conflict = False
-        if room_timetable is not None:
+        if busy_by_day is not None:
             for day in lab_days:
-                if check_room_conflict(day, lab_start, lab_end, room_timetable):
+                if any(lab_start < end and start < lab_end
+                       for start, end in busy_by_day.get(day, ())):
                     has_room_conflict = True
                     break
         
         if not has_room_conflict:
-            return (lab_days, lab_start, lab_end)
+            return (list(lab_days), lab_start, lab_end)
     
     return None
 
@@ -140,40 +185,37 @@ def insert_lab_into_timetable(course, room_timetable: Optional[Dict] = None):
             lab.start = lab_start
             lab.end = lab_end
         else:
-            if course.biweekly_lab_freq == 1 and course.lab_duration == 165:
-                d = random.choice(day_of_week_lab)
-                lab.day = [d]
-                if any(d in day.value for day in course.lecture.day):
-                    diff = -1
-                    attempts = 0
-                    while 0 >= diff and attempts < 120:
-                        lab_start = random.choice(lab_165_start)
-                        if lab_start > course.lecture.start:
-                            diff = lab_start - course.lecture.end
-                        elif course.lecture.start > lab_start:
-                            diff = course.lecture.end - 165 - lab_start
-                        attempts += 1
-                    lab.start = lab_start
-                else:
-                    lab.start = random.choice(lab_165_start)
-                lab.end = lab.start + 165
-            elif course.biweekly_lab_freq == 1 and course.lab_duration == 100:
-                d = random.choice(day_of_week_lab)
-                lab.day = [d]
-                if any(d in day.value for day in course.lecture.day):
-                    diff = -1
-                    attempts = 0
-                    while 0 >= diff and attempts < 120:
-                        lab_start = random.choice(tut_100_start)
-                        if lab_start > course.lecture.start:
-                            diff = lab_start - course.lecture.end
-                        elif course.lecture.start > lab_start:
-                            diff = course.lecture.end - 100 - lab_start
-                        attempts += 1
-                    lab.start = lab_start
-                else:
-                    lab.start = random.choice(tut_100_start)    
-                lab.end = lab.start + 100
+            starts = _FALLBACK_LAB_STARTS.get((course.biweekly_lab_freq, course.lab_duration))
+            if starts is None:
+                continue
+            duration = course.lab_duration
+            d = random.choice(day_of_week_lab)
+            lab.day = [d]
+            if course.day_mask & (1 << d):
+                lab.start = choose_start_avoiding_lecture(duration, course.lecture)
+            else:
+                lab.start = random.choice(starts)
+            lab.end = lab.start + duration
+
+
+def add_course_to_room_timetable(room_timetable: Dict, course, room_info) -> None:
+    """Append a course's scheduled lab slots to room_timetable under its room."""
+    if room_info is None or not course.lab or course.lab_count == 0:
+        return
+    
+    slots = room_timetable.setdefault(room_info, [])
+    
+    for lab in course.lab:
+        if lab is None or not lab.day:
+            continue
+        
+        for day in lab.day:
+            slots.append({
+                'day': day,
+                'start': lab.start,
+                'end': lab.end,
+                'course': f"{course.subject}{course.catalog_nbr}"
+            })
 
 
 def build_room_timetable_for_schedule(schedule, room_assignments):
@@ -186,26 +228,8 @@ def build_room_timetable_for_schedule(schedule, room_assignments):
         if not course.lab or course.lab_count == 0:
             continue
         
-        room_info = find_room_for_course(course, room_assignments)
-        if room_info is None:
-            continue
-        
-        bldg, room = room_info
-        
-        if (bldg, room) not in room_timetable:
-            room_timetable[(bldg, room)] = []
-        
-        for lab in course.lab:
-            if lab is None or not lab.day:
-                continue
-            
-            for day in lab.day:
-                room_timetable[(bldg, room)].append({
-                    'day': day,
-                    'start': lab.start,
-                    'end': lab.end,
-                    'course': f"{course.subject}{course.catalog_nbr}"
-                })
+        add_course_to_room_timetable(room_timetable, course,
+                                     find_room_for_course(course, room_assignments))
     
     return room_timetable
 
@@ -215,50 +239,51 @@ def has_valid_lab_tut_combination(course):
     if not course.lab or not course.tutorial:
         return True
     
+    tutorials = [tut for tut in course.tutorial if tut is not None]
+    
     for lab in course.lab:
         if lab is None:
             continue
-        for tut in course.tutorial:
-            if tut is None:
-                continue
+        for tut in tutorials:
             if not times_overlap(lab, tut):
                 return True
     
     return False
 
 
-def times_overlap(element1, element2):
-    """Check if two course elements overlap in time."""
-    days1 = set(element1.day)
-    days2 = set(element2.day)
-    
-    if not days1.intersection(days2):
-        return False
-    
-    return element1.start < element2.end and element2.start < element1.end
-
-
 def initialize_course_with_validation(course, max_attempts=100, room_assignments=None, 
-                                     existing_schedule=None):
-    """Initialize a course's labs and tutorials with validation."""
-    room_timetable = None
-    if room_assignments is not None and existing_schedule is not None:
-        room_timetable = build_room_timetable_for_schedule(existing_schedule, room_assignments)
+                                     existing_schedule=None, room_timetable=None, room_lookup=None):
+    """Initialize a course's labs and tutorials with validation.
+
+    A caller-owned room_timetable (built up course by course) replaces rebuilding one
+    from existing_schedule; the course's placed labs are appended to it. room_lookup is
+    an optional build_room_lookup(room_assignments) index reused across calls.
+    """
+    slot_timetable = None
+    room_info = None
+    if room_assignments is not None and (room_timetable is not None or existing_schedule is not None):
+        if room_timetable is not None:
+            slot_timetable = room_timetable
+        else:
+            slot_timetable = build_room_timetable_for_schedule(existing_schedule, room_assignments)
         
-        from room_management import find_room_for_course
-        room_info = find_room_for_course(course, room_assignments)
+        if room_lookup is not None:
+            from room_management import lookup_room_for_course
+            room_info = lookup_room_for_course(course, room_lookup)
+        else:
+            from room_management import find_room_for_course
+            room_info = find_room_for_course(course, room_assignments)
         if room_info is not None:
-            bldg, room = room_info
-            if (bldg, room) not in room_timetable:
-                room_timetable[(bldg, room)] = []
-            room_timetable = {(bldg, room): room_timetable[(bldg, room)]}
+            slot_timetable = {room_info: slot_timetable.get(room_info, [])}
     
+    placed = False
     for attempt in range(max_attempts):
         insert_tut_into_timetable(course)
-        insert_lab_into_timetable(course, room_timetable)
+        insert_lab_into_timetable(course, slot_timetable)
         
         if has_valid_lab_tut_combination(course):
-            return True
+            placed = True
+            break
         
         for tut in course.tutorial:
             if tut:
@@ -272,4 +297,7 @@ def initialize_course_with_validation(course, max_attempts=100, room_assignments
                 lab.start = 0
                 lab.end = 0
     
-    return False
+    if room_timetable is not None:
+        add_course_to_room_timetable(room_timetable, course, room_info)
+    
+    return placed
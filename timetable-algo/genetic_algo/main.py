@@ -7,14 +7,12 @@ from pathlib import Path
 parent_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(parent_dir))
 
-import csv
 from initialization import initialize_course_with_validation
 from course import Course
 from typing import List
 from config import (POPULATION_SIZE, MUTATION_COUNT, 
                     LIMIT_POPULATION_GENERATION, LIMIT_FITTEST_UNCHANGED_GENERATION,
                     FITNESS_RATIO_THRESHOLD, TARGET_SEASON, ACADEMIC_YEAR)
-from copy import deepcopy
 from fitness import evaluate_population, fitness_function, display_fitness_details, display_schedule_structure
 from helper.sequence_loader import Sequence
 from sequence_validation import has_valid_sequence_combination
@@ -24,27 +22,15 @@ from mutation import mutate
 from replacement import replace_worst_individuals, display_replacement_summary
 from termination import (should_terminate, display_termination_status, 
                         display_final_statistics)
-from room_management import load_room_assignments, create_room_timetables, display_room_timetable, validate_room_timetables
+from room_management import load_room_assignments, build_room_lookup, create_room_timetables, display_room_timetable, validate_room_timetables
 from helper.export_utils import export_fittest_individual, display_export_summary
 from helper.conflict_export import export_conflicts_csv
 from helper.scheduleterm_export import export_to_scheduleterm_format
 from helper.db_room_extractor import extract_and_generate_room_data
 from helper.db_sequence_extractor import extract_and_generate_sequences
 from helper.db_course_extractor import extract_and_generate_course_data
-
-def should_include_course(subject: str, catalog: str) -> bool:
-    """Determine if a course should be included in scheduling (COEN, ELEC, ENGR 290)."""
-    subject = subject.upper().strip()
-    catalog = catalog.strip()
-    
-    if subject == "COEN":
-        return True
-    if subject == "ELEC":
-        return True
-    if subject == "ENGR" and catalog == "290":
-        return True
-    
-    return False
+# Data.csv is already filtered by the extractor, so every ELEC row is kept here.
+from course_filter import should_include_course_all_elec as should_include_course
 
 
 def read_courses_from_csv(path: str) -> List[Course]:
@@ -52,23 +38,18 @@ def read_courses_from_csv(path: str) -> List[Course]:
     if not os.path.isfile(path):
         raise FileNotFoundError(f"CSV file not found: {path}")
 
-    courses: List[Course] = []
     filtered_count = 0
 
-    with open(path, "r", newline="", encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
-        for i, row in enumerate(reader, start=2):
-            try:
-                subject = row.get('subject', '').strip()
-                catalog = row.get('catalog_nbr', '').strip()
-                
-                if not should_include_course(subject, catalog):
-                    filtered_count += 1
-                    continue
-                
-                courses.append(Course.from_csv_row(row))
-            except Exception as e:
-                raise ValueError(f"Error parsing CSV at line {i}: {e}\nRow={row}") from e
+    def include(subject: str, catalog: str) -> bool:
+        nonlocal filtered_count
+        if should_include_course(subject, catalog):
+            return True
+        filtered_count += 1
+        return False
+
+    courses = Course.bulk_from_csv(path, include=include)
+    if filtered_count:
+        print(f"Filtered out {filtered_count} courses not in the scheduled subjects")
     
     return courses
 
@@ -77,14 +58,17 @@ def initialize_population(courses: List[Course], population_size: int,
                            room_assignments=None) -> List[List[Course]]:
     """Initialize the population with random valid schedules."""
     population: List[List[Course]] = []
+    room_lookup = build_room_lookup(room_assignments) if room_assignments is not None else None
     
     for i in range(population_size):
         individual = []
+        room_timetable = {}
         for c in courses:
-            course_copy = deepcopy(c)
+            course_copy = c.clone()
             if not initialize_course_with_validation(course_copy,
                                                      room_assignments=room_assignments,
-                                                     existing_schedule=individual):
+                                                     room_timetable=room_timetable,
+                                                     room_lookup=room_lookup):
                 print(f"Warning: Could not fully initialize {course_copy.subject}{course_copy.catalog_nbr}")
             individual.append(course_copy)
         population.append(individual)
@@ -99,6 +83,7 @@ def run_one_generation(population: List[List[Course]],
                        num_offspring: int = 2) -> tuple[List[List[Course]], List[float]]:
     """Run one generation of the genetic algorithm."""
     offspring_list = []
+    core_sequences = seq.year
     
     for _ in range(num_offspring):
         parent_indices = select_parents(fitness_scores, num_parents=2)
@@ -108,21 +93,21 @@ def run_one_generation(population: List[List[Course]],
         offspring = uniform_crossover(
             parent1=parent1,
             parent2=parent2,
-            core_sequences=seq.year,
+            core_sequences=core_sequences,
             crossover_rate=0.5,
             room_assignments=room_assignments
         )
         
         mutated = mutate(
             offspring=offspring,
-            core_sequences=seq.year,
+            core_sequences=core_sequences,
             mutation_count=MUTATION_COUNT,
             room_assignments=room_assignments
         )
         
         offspring_list.append(mutated)
     
-    offspring_fitness = [fitness_function(off, core_sequences=seq.year, room_assignments=room_assignments) 
+    offspring_fitness = [fitness_function(off, core_sequences=core_sequences, room_assignments=room_assignments) 
                         for off in offspring_list]
     
     new_population, new_fitness_scores = replace_worst_individuals(
@@ -202,7 +187,8 @@ if __name__ == "__main__":
             fitness_history=fitness_history,
             max_generations=LIMIT_POPULATION_GENERATION,
             unchanged_limit=LIMIT_FITTEST_UNCHANGED_GENERATION,
-            ratio_threshold=FITNESS_RATIO_THRESHOLD
+            ratio_threshold=FITNESS_RATIO_THRESHOLD,
+            max_fitness=best_fitness
         )
         
         if terminate:
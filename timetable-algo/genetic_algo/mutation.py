@@ -1,26 +1,12 @@
 # mutation.py
 import random
-from copy import deepcopy
 from typing import List, Optional
 from course import Course
+from fitness import times_overlap
 from initialization import (insert_tut_into_timetable, insert_lab_into_timetable, 
                            build_room_timetable_for_schedule, find_conflict_free_lab_slot)
 from config import MUTATION_COUNT
 
-def times_overlap(element1, element2):
-    """Check if two course elements overlap in time."""
-    if element1 is None or element2 is None:
-        return False
-    
-    days1 = set(element1.day)
-    days2 = set(element2.day)
-    
-    if not days1.intersection(days2):
-        return False
-    
-    return element1.start < element2.end and element2.start < element1.end
-
-
 def is_core_sequence_course(course, core_sequences):
     """Check if a course is part of any core sequence."""
     course_code = course.subject + course.catalog_nbr
@@ -75,7 +61,7 @@ def reschedule_course_safely(course, max_attempts=100, room_assignments=None,
                 room_timetable = {(bldg, room): []}
     
     for attempt in range(max_attempts):
-        new_course = deepcopy(course)
+        new_course = course.clone()
         
         if new_course.tutorial and new_course.tut_count > 0:
             insert_tut_into_timetable(new_course)
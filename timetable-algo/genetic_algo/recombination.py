@@ -1,25 +1,11 @@
 # recombination.py
 import random
-from copy import deepcopy
 from typing import List, Optional
 from course import Course
+from fitness import times_overlap
 from initialization import (insert_tut_into_timetable, insert_lab_into_timetable,
                            build_room_timetable_for_schedule)
 
-def times_overlap(element1, element2):
-    """Check if two course elements overlap in time."""
-    if element1 is None or element2 is None:
-        return False
-    
-    days1 = set(element1.day)
-    days2 = set(element2.day)
-    
-    if not days1.intersection(days2):
-        return False
-    
-    return element1.start < element2.end and element2.start < element1.end
-
-
 def has_valid_sequence_combination(schedule, sequence_courses):
     """Check if there's at least one valid combination of tutorials/labs without overlaps."""
     from itertools import product
@@ -142,7 +128,7 @@ def minimize_overlap_placement(course, offspring, core_sequence_courses,
                 room_timetable = {(bldg, room): []}
     
     for attempt in range(max_attempts):
-        temp_course = deepcopy(course)
+        temp_course = course.clone()
         
         insert_tut_into_timetable(temp_course)
         insert_lab_into_timetable(temp_course, room_timetable)
@@ -183,11 +169,11 @@ def uniform_crossover(parent1, parent2, core_sequences, crossover_rate=0.5,
             raise ValueError(f"Parents have mismatched courses at index {i}")
         
         if random.random() < crossover_rate:
-            selected_course = deepcopy(course1)
-            backup_course = deepcopy(course2)
+            selected_course = course1.clone()
+            backup_course = course2.clone()
         else:
-            selected_course = deepcopy(course2)
-            backup_course = deepcopy(course1)
+            selected_course = course2.clone()
+            backup_course = course1.clone()
         
         is_core, sequence_list = is_core_sequence_course(selected_course, core_sequences)
         
@@ -105,6 +105,26 @@ def find_room_for_course(course: Course, room_assignments: List[RoomAssignment])
     return None
 
 
+def build_room_lookup(room_assignments) -> Dict[Tuple[str, str], Tuple[str, str]]:
+    """Index room assignments by (subject, catalog) -> (bldg, room); dicts are returned as-is."""
+    if isinstance(room_assignments, dict):
+        return room_assignments
+    
+    lookup = {}
+    if isinstance(room_assignments, list):
+        for assignment in room_assignments:
+            subject = assignment.subject.strip().upper()
+            for catalog in assignment.catalog_nbrs:
+                # First matching assignment wins, as in find_room_for_course.
+                lookup.setdefault((subject, catalog), (assignment.bldg, assignment.room))
+    return lookup
+
+
+def lookup_room_for_course(course: Course, room_lookup: Dict[Tuple[str, str], Tuple[str, str]]) -> Optional[Tuple[str, str]]:
+    """Same result as find_room_for_course, read from a build_room_lookup index."""
+    return room_lookup.get((course.subject.upper(), course.catalog_nbr))
+
+
 def create_room_timetables(schedule: List[Course], 
                           room_assignments: List[RoomAssignment]) -> Dict[Tuple[str, str], RoomTimetable]:
     """Create room timetables for all labs in a schedule."""
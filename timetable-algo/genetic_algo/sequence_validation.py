@@ -1,19 +1,6 @@
 # sequence_validation.py
 from itertools import product
-
-def times_overlap(element1, element2):
-    """Check if two course elements overlap in time."""
-    if element1 is None or element2 is None:
-        return False
-    
-    days1 = set(element1.day)
-    days2 = set(element2.day)
-    
-    if not days1.intersection(days2):
-        return False
-    
-    return element1.start < element2.end and element2.start < element1.end
-
+from fitness import times_overlap
 
 def get_course_by_code(schedule, course_code):
     """Find a course in the schedule by its subject+catalog_nbr."""
@@ -1,5 +1,5 @@
 # termination.py
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 def check_generation_limit(current_generation: int, max_generations: int) -> Tuple[bool, str]:
     """Check if the algorithm has reached the maximum generation limit."""
@@ -8,13 +8,15 @@ def check_generation_limit(current_generation: int, max_generations: int) -> Tup
     return False, ""
 
 
-def check_fitness_ratio(fitness_scores: List[float], ratio_threshold: float = 0.9) -> Tuple[bool, str]:
+def check_fitness_ratio(fitness_scores: List[float], ratio_threshold: float = 0.9,
+                        max_fitness: Optional[float] = None) -> Tuple[bool, str]:
     """Check if the ratio of mean fitness to max fitness exceeds threshold (mean/max >= 0.9)."""
     if not fitness_scores:
         return False, ""
     
     mean_fitness = sum(fitness_scores) / len(fitness_scores)
-    max_fitness = max(fitness_scores)
+    if max_fitness is None:
+        max_fitness = max(fitness_scores)
     
     if max_fitness <= 0:
         return False, ""
@@ -49,13 +51,17 @@ def should_terminate(current_generation: int,
                     fitness_history: List[float],
                     max_generations: int,
                     unchanged_limit: int,
-                    ratio_threshold: float = 0.9) -> Tuple[bool, str]:
-    """Check all termination conditions: (i) generation limit, (ii) fitness ratio, (iii) stagnation."""
+                    ratio_threshold: float = 0.9,
+                    max_fitness: Optional[float] = None) -> Tuple[bool, str]:
+    """Check all termination conditions: (i) generation limit, (ii) fitness ratio, (iii) stagnation.
+
+    max_fitness, if the caller already has max(fitness_scores), saves rescanning the scores.
+    """
     terminate, reason = check_generation_limit(current_generation, max_generations)
     if terminate:
         return True, f"(i) {reason}"
     
-    terminate, reason = check_fitness_ratio(fitness_scores, ratio_threshold)
+    terminate, reason = check_fitness_ratio(fitness_scores, ratio_threshold, max_fitness)
     if terminate:
         return True, f"(ii) {reason}"
     
@@ -2,23 +2,10 @@
 import csv
 from typing import List, Dict, Tuple
 from genetic_algo.course import Course
+from genetic_algo.fitness import times_overlap
 from itertools import product
 
 
-def times_overlap(element1, element2):
-    """Check if two course elements overlap in time."""
-    if element1 is None or element2 is None:
-        return False
-    
-    days1 = set(element1.day)
-    days2 = set(element2.day)
-    
-    if not days1.intersection(days2):
-        return False
-    
-    return element1.start < element2.end and element2.start < element1.end
-
-
 def minutes_to_time_string(minutes: int) -> str:
     """Convert minutes from midnight to HH:MM format."""
     hours = minutes // 60
@@ -21,3 +21,15 @@ def fetch_all(sql, params=None):
             return cur.fetchall()
     finally:
         conn.close()
+
+
+def fetch_iter(sql, params=None, itersize=2000):
+    """Yield rows from a server-side cursor, fetching itersize rows per round-trip."""
+    conn = get_connection()
+    try:
+        with conn.cursor(name="fetch_iter", cursor_factory=RealDictCursor) as cur:
+            cur.itersize = itersize
+            cur.execute(sql, params)
+            yield from cur
+    finally:
+        conn.close()
@@ -1,23 +1,50 @@
 # db_course_extractor.py
 import csv
-from collections import defaultdict
-from typing import List, Dict, Tuple
+from functools import lru_cache
+from operator import itemgetter
+from typing import Iterable, Iterator, List, Dict, Tuple
 from datetime import datetime, time
-from .db import fetch_all
-from genetic_algo.course_filter import should_include_course
+from .db import fetch_all, fetch_iter
+from genetic_algo.course_filter import (should_include_course, EXCLUDED_ELEC_COURSES,
+                                        get_included_subjects, get_partial_course_codes)
+
+# Data.csv header, in the column order genetic_algo.course.CSV_FIELDS reads back.
+CSV_FIELDS = (
+    "subject", "catalog_nbr", "class_nbr", "day_of_week", "start_time", "end_time",
+    "lab_count", "biweekly_lab_freq", "lab_duration",
+    "tut_count", "weekly_tut_freq", "tut_duration",
+)
+
+
+# course_filter's subject rule as SQL; bind included_course_params() to its placeholders.
+INCLUDED_COURSE_SQL = """(UPPER(TRIM(subject)) = ANY(%s)
+               OR UPPER(TRIM(subject)) || ' ' || TRIM(catalog) = ANY(%s))"""
+
+
+def included_course_params() -> Tuple[List[str], List[str]]:
+    """Parameters for INCLUDED_COURSE_SQL: fully included subjects and partial course codes."""
+    return list(get_included_subjects()), get_partial_course_codes()
 
 
 def build_termcode(year: int, season_code: int) -> str:
     """Build termcode from year and season (Format: 2 + YY + S)."""
-    year_suffix = str(year)[-2:]
-    return f"2{year_suffix}{season_code}"
+    return f"2{year % 100:02d}{season_code}"
+
+
+def _parse_hms(s: str) -> time:
+    """Parse an "HH:MM:SS" string, falling back to strptime for other shapes."""
+    if len(s) == 8 and s[2] == ':' and s[5] == ':':
+        hh, mm, ss = s[:2], s[3:5], s[6:]
+        if hh.isdecimal() and mm.isdecimal() and ss.isdecimal():
+            return time(int(hh), int(mm), int(ss))
+    return datetime.strptime(s, "%H:%M:%S").time()
 
 
 def parse_time_to_dotted(time_obj) -> str:
     """Convert time object to dotted format (HH.MM.SS)."""
     if isinstance(time_obj, str):
         try:
-            time_obj = datetime.strptime(time_obj, "%H:%M:%S").time()
+            time_obj = _parse_hms(time_obj)
         except:
             return "00.00.00"
     
@@ -30,9 +57,9 @@ def parse_time_to_dotted(time_obj) -> str:
 def calculate_duration_minutes(start_time, end_time) -> int:
     """Calculate duration in minutes between start and end times."""
     if isinstance(start_time, str):
-        start_time = datetime.strptime(start_time, "%H:%M:%S").time()
+        start_time = _parse_hms(start_time)
     if isinstance(end_time, str):
-        end_time = datetime.strptime(end_time, "%H:%M:%S").time()
+        end_time = _parse_hms(end_time)
     
     start_minutes = start_time.hour * 60 + start_time.minute
     end_minutes = end_time.hour * 60 + end_time.minute
@@ -40,42 +67,65 @@ def calculate_duration_minutes(start_time, end_time) -> int:
     return end_minutes - start_minutes
 
 
+_DAY_COLUMNS = ('mondays', 'tuesdays', 'wednesdays', 'thursdays', 'fridays', 'saturdays', 'sundays')
+_DAY_ABBREVS = ('Mo', 'Tu', 'We', 'Th', 'Fr', 'Sa', 'Su')
+_DAY_GET = itemgetter(*_DAY_COLUMNS)
+
+# Day pattern for every 7-bit day mask (bit 0 = Monday).
+_DAY_PATTERNS = tuple(
+    ''.join(abbrev for bit, abbrev in enumerate(_DAY_ABBREVS) if mask >> bit & 1)
+    for mask in range(1 << len(_DAY_ABBREVS))
+)
+
+
+def _is_true(value) -> bool:
+    # Drivers normally return bool or NULL; only other values need the string check.
+    if value is True or value is False or value is None:
+        return value is True
+    return value == True or str(value).lower() == 'true'
+
+
 def parse_day_pattern(row: Dict) -> str:
     """Build day pattern from boolean day columns (e.g., "MoWe", "TuTh")."""
-    day_map = [
-        ('mondays', 'Mo'), ('tuesdays', 'Tu'), ('wednesdays', 'We'),
-        ('thursdays', 'Th'), ('fridays', 'Fr'), ('saturdays', 'Sa'), ('sundays', 'Su')
-    ]
+    try:
+        flags = _DAY_GET(row)
+    except KeyError:
+        flags = tuple(row.get(col) for col in _DAY_COLUMNS)
     
-    days = []
-    for col, abbrev in day_map:
-        if row.get(col) == True or str(row.get(col)).lower() == 'true':
-            days.append(abbrev)
+    mask = 0
+    for bit, value in enumerate(flags):
+        if _is_true(value):
+            mask |= 1 << bit
     
-    return ''.join(days)
-
-
-def fetch_schedule_data(termcode: str, department_code: str = "ELECCOEN") -> List[Dict]:
-    """Fetch schedule data from database for specified term and department."""
-    sql = """
-        SELECT subject, catalog, section, componentcode, termcode, classnumber,
-               session, buildingcode, room, instructionmodecode, locationcode,
-               classstarttime, classendtime, classstartdate, classenddate,
-               mondays, tuesdays, wednesdays, thursdays, fridays, saturdays, sundays,
-               currentwaitlisttotal, waitlistcapacity, enrollmentcapacity, currentenrollment,
-               departmentcode, facultycode, facultydescription, career,
-               meetingpatternnumber
+    return _DAY_PATTERNS[mask]
+
+
+def fetch_schedule_data(termcode: str, department_code: str = "ELECCOEN",
+                        stream: bool = False) -> Iterable[Dict]:
+    """Fetch the columns Data.csv needs from scheduleterm for a term and department.
+
+    With stream=True rows are yielded from a server-side cursor instead of a list.
+    """
+    sql = f"""
+        SELECT subject, catalog, section, componentcode,
+               classstarttime, classendtime,
+               mondays, tuesdays, wednesdays, thursdays, fridays, saturdays, sundays
         FROM scheduleterm
         WHERE termcode = %s 
           AND departmentcode = %s
           AND meetingpatternnumber = 1
           AND classstarttime != '00:00:00'
+          AND {INCLUDED_COURSE_SQL}
+          AND NOT (UPPER(TRIM(subject)) = 'ELEC' AND TRIM(catalog) = ANY(%s))
         ORDER BY subject, catalog, classnumber, componentcode
     """
     
-    return fetch_all(sql, (termcode, department_code))
+    fetch = fetch_iter if stream else fetch_all
+    return fetch(sql, (termcode, department_code, *included_course_params(),
+                       sorted(EXCLUDED_ELEC_COURSES)))
 
 
+@lru_cache(maxsize=4096)
 def extract_base_section(section: str, componentcode: str) -> str:
     """Extract the base lecture section identifier from a section string."""
     if componentcode == 'LEC':
@@ -95,9 +145,14 @@ def extract_base_section(section: str, componentcode: str) -> str:
     return section
 
 
+_CSV_BUFFER_SIZE = 1 << 20
+
+_GROUPED_COMPONENTS = frozenset(('LEC', 'TUT', 'LAB'))
+
+
 def group_by_lecture(records: List[Dict]) -> Dict:
     """Group schedule records by lecture sections."""
-    grouped = defaultdict(lambda: {'lecture': None, 'tutorials': [], 'labs': []})
+    grouped = {}
     
     for record in records:
         subject = record['subject']
@@ -105,30 +160,29 @@ def group_by_lecture(records: List[Dict]) -> Dict:
         section = record['section']
         component = record['componentcode']
         
-        if not should_include_course(subject, catalog):
+        if component not in _GROUPED_COMPONENTS or not should_include_course(subject, catalog):
             continue
         
-        base_section = extract_base_section(section, component)
+        base_section = section.strip() if component == 'LEC' else extract_base_section(section, component)
         key = (subject, catalog, base_section)
         
+        entry = grouped.get(key)
+        if entry is None:
+            entry = grouped[key] = {'lecture': None, 'tutorials': [], 'labs': []}
+        
         if component == 'LEC':
-            grouped[key]['lecture'] = record
+            entry['lecture'] = record
         elif component == 'TUT':
-            grouped[key]['tutorials'].append(record)
+            entry['tutorials'].append(record)
         elif component == 'LAB':
-            grouped[key]['labs'].append(record)
+            entry['labs'].append(record)
     
     return grouped
 
 
 def count_unique_sections(components: List[Dict]) -> int:
     """Count unique sections based on section identifiers."""
-    sections = set()
-    for comp in components:
-        section = comp.get('section', '')
-        sections.add(section)
-    
-    return len(sections)
+    return len({comp.get('section', '') for comp in components})
 
 
 def determine_lab_frequency(labs: List[Dict]) -> int:
@@ -145,23 +199,11 @@ def determine_tutorial_frequency(tutorials: List[Dict]) -> int:
     return 1
 
 
-def generate_data_csv(output_path: str = "Data.csv", 
-                     year: int = 2025, 
-                     season_code: int = 2) -> int:
-    """Generate Data.csv from database scheduleterm table."""
-    previous_year = year - 1
-    termcode = build_termcode(previous_year, season_code)
-    
-    records = fetch_schedule_data(termcode, "ELECCOEN")
-    
-    if not records:
-        return 0
-    
-    grouped = group_by_lecture(records)
-    
-    rows = []
-    
-    for (subject, catalog, classnumber), data in sorted(grouped.items()):
+def iter_data_rows(grouped: Dict) -> Iterator[Tuple]:
+    """Yield one Data.csv row (ordered as CSV_FIELDS) per grouped section with a lecture."""
+    for key in sorted(grouped):
+        subject, catalog, classnumber = key
+        data = grouped[key]
         lecture = data['lecture']
         
         if not lecture:
@@ -195,35 +237,44 @@ def generate_data_csv(output_path: str = "Data.csv",
             )
             biweekly_lab_freq = determine_lab_frequency(data['labs'])
         
-        row = {
-            'subject': subject,
-            'catalog_nbr': catalog,
-            'class_nbr': classnumber,
-            'day_of_week': day_pattern,
-            'start_time': start_time,
-            'end_time': end_time,
-            'lab_count': lab_count if lab_count > 0 else '',
-            'biweekly_lab_freq': biweekly_lab_freq if lab_count > 0 else '',
-            'lab_duration': lab_duration if lab_count > 0 else '',
-            'tut_count': tut_count if tut_count > 0 else '',
-            'weekly_tut_freq': weekly_tut_freq if tut_count > 0 else '',
-            'tut_duration': tut_duration if tut_count > 0 else ''
-        }
+        has_labs = lab_count > 0
+        has_tuts = tut_count > 0
         
-        rows.append(row)
+        yield (
+            subject, catalog, classnumber, day_pattern, start_time, end_time,
+            lab_count if has_labs else '',
+            biweekly_lab_freq if has_labs else '',
+            lab_duration if has_labs else '',
+            tut_count if has_tuts else '',
+            weekly_tut_freq if has_tuts else '',
+            tut_duration if has_tuts else '',
+        )
+
+
+def generate_data_csv(output_path: str = "Data.csv", 
+                     year: int = 2025, 
+                     season_code: int = 2) -> int:
+    """Generate Data.csv from database scheduleterm table."""
+    previous_year = year - 1
+    termcode = build_termcode(previous_year, season_code)
+    
+    grouped = group_by_lecture(fetch_schedule_data(termcode, "ELECCOEN", stream=True))
     
-    fieldnames = [
-        'subject', 'catalog_nbr', 'class_nbr', 'day_of_week',
-        'start_time', 'end_time', 'lab_count', 'biweekly_lab_freq',
-        'lab_duration', 'tut_count', 'weekly_tut_freq', 'tut_duration'
-    ]
+    if not grouped:
+        return 0
     
-    with open(output_path, 'w', newline='', encoding='utf-8-sig') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    row_count = 0
+    
+    with open(output_path, 'w', newline='', encoding='utf-8-sig', buffering=_CSV_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_FIELDS)
+        writerow = writer.writerow
+        
+        for row in iter_data_rows(grouped):
+            writerow(row)
+            row_count += 1
     
-    return len(rows)
+    return row_count
 
 
 def display_data_summary(output_path: str = "Data.csv"):
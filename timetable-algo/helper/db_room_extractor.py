@@ -3,21 +3,7 @@ import csv
 from collections import defaultdict
 from typing import List, Dict, Tuple
 from .db import fetch_all
-
-
-def should_include_course(subject: str, catalog: str) -> bool:
-    """Determine if a course should be included in scheduling (COEN, ELEC, ENGR 290)."""
-    subject = subject.upper().strip()
-    catalog = catalog.strip()
-    
-    if subject == "COEN":
-        return True
-    if subject == "ELEC":
-        return True
-    if subject == "ENGR" and catalog == "290":
-        return True
-    
-    return False
+from .db_course_extractor import INCLUDED_COURSE_SQL, included_course_params
 
 
 def fetch_lab_rooms() -> Dict[int, Dict]:
@@ -47,44 +33,25 @@ def fetch_lab_rooms() -> Dict[int, Dict]:
 
 def fetch_course_lab_assignments() -> List[Dict]:
     """Fetch all course-lab room assignments from the database (COEN, ELEC, ENGR 290 only)."""
-    sql = """
-        SELECT labroomid, subject, catalog, comments
+    sql = f"""
+        SELECT labroomid, subject, catalog, COALESCE(comments, '') AS comments
         FROM courselabs
+        WHERE {INCLUDED_COURSE_SQL}
         ORDER BY subject, catalog, labroomid
     """
     
-    rows = fetch_all(sql)
-    
-    assignments = []
-    
-    for row in rows:
-        if not should_include_course(row['subject'], row['catalog']):
-            continue
-        
-        assignments.append({
-            'labroomid': row['labroomid'],
-            'subject': row['subject'],
-            'catalog': row['catalog'],
-            'comments': row['comments'] or ''
-        })
-    
-    return assignments
+    return fetch_all(sql, included_course_params())
 
 
 def group_courses_by_room(assignments: List[Dict]) -> Dict[int, List[Tuple[str, str]]]:
     """Group courses by their assigned lab room."""
-    room_courses = defaultdict(list)
+    # Dict keys give O(1) de-duplication while keeping first-seen order.
+    room_courses = defaultdict(dict)
     
     for assignment in assignments:
-        labroomid = assignment['labroomid']
-        subject = assignment['subject']
-        catalog = assignment['catalog']
-        
-        course_tuple = (subject, catalog)
-        if course_tuple not in room_courses[labroomid]:
-            room_courses[labroomid].append(course_tuple)
+        room_courses[assignment['labroomid']][(assignment['subject'], assignment['catalog'])] = None
     
-    return room_courses
+    return {labroomid: list(courses) for labroomid, courses in room_courses.items()}
 
 
 def generate_room_data_csv(output_path: str = "Room_data.csv") -> int:
@@ -94,6 +61,7 @@ def generate_room_data_csv(output_path: str = "Room_data.csv") -> int:
     room_courses = group_courses_by_room(assignments)
     
     rows = []
+    max_courses = 0
     
     for labroomid in sorted(room_courses.keys()):
         if labroomid not in lab_rooms:
@@ -122,9 +90,7 @@ def generate_room_data_csv(output_path: str = "Room_data.csv") -> int:
                 row[f'course{i}'] = catalog
             
             rows.append(row)
-    
-    max_courses = max(len([k for k in row.keys() if k.startswith('course')]) 
-                     for row in rows) if rows else 0
+            max_courses = max(max_courses, len(unique_catalogs))
     
     fieldnames = ['bldg', 'room', 'subject'] + [f'course{i}' for i in range(1, max_courses + 1)]
     
@@ -1,7 +1,21 @@
 # db_timetable_export.py
-from typing import List, Dict
+import csv
+import io
+from typing import List, Dict, Tuple
 from .db import get_connection
 from genetic_algo.course import Course
+from genetic_algo.room_management import build_room_lookup
+
+
+# FORCE_NOT_NULL keeps empty text fields as '' (CSV COPY would otherwise load NULL).
+COPY_SCHEDULE_SQL = """
+    COPY optimized_schedule
+    (subject, catalog, section, componentcode, termcode, classnumber,
+     buildingcode, room, classstarttime, classendtime,
+     mondays, tuesdays, wednesdays, thursdays, fridays, saturdays, sundays)
+    FROM STDIN WITH (FORMAT csv, FORCE_NOT_NULL (subject, catalog, section, componentcode,
+                                                 termcode, classnumber, buildingcode, room))
+"""
 
 
 def create_optimized_schedule_table():
@@ -52,51 +66,71 @@ def create_optimized_schedule_table():
         conn.close()
 
 
+DAY_COLUMNS = ('mondays', 'tuesdays', 'wednesdays', 'thursdays', 'fridays', 'saturdays', 'sundays')
+
+_NO_DAYS = (False,) * len(DAY_COLUMNS)
+
+# Day number -> (mondays, ..., sundays) flags; 1-5 Week 1, 8-12 Week 2.
+_DAY_FLAGS = {
+    day_num: tuple(i == (day_num - 1) % 7 for i in range(len(DAY_COLUMNS)))
+    for day_num in (1, 2, 3, 4, 5, 8, 9, 10, 11, 12)
+}
+
+
+def day_number_to_day_flags(day_num: int) -> Tuple[bool, ...]:
+    """Get the seven day-column flags for a day number, in DAY_COLUMNS order."""
+    return _DAY_FLAGS.get(day_num, _NO_DAYS)
+
+
 def day_number_to_day_columns(day_num: int) -> Dict[str, bool]:
     """Convert day number to boolean day columns (1-5 Week 1, 8-12 Week 2)."""
-    day_map = {
-        1: 'mondays', 2: 'tuesdays', 3: 'wednesdays', 4: 'thursdays', 5: 'fridays',
-        8: 'mondays', 9: 'tuesdays', 10: 'wednesdays', 11: 'thursdays', 12: 'fridays'
-    }
-    
-    result = {
-        'mondays': False, 'tuesdays': False, 'wednesdays': False,
-        'thursdays': False, 'fridays': False, 'saturdays': False, 'sundays': False
-    }
-    
-    day_col = day_map.get(day_num)
-    if day_col:
-        result[day_col] = True
-    
-    return result
+    return dict(zip(DAY_COLUMNS, day_number_to_day_flags(day_num)))
+
+
+_TIME_STRINGS = tuple(f"{m // 60:02d}:{m % 60:02d}:00" for m in range(24 * 60 + 1))
 
 
 def minutes_to_time(minutes: int) -> str:
     """Convert minutes since midnight to HH:MM:SS format."""
+    if 0 <= minutes < len(_TIME_STRINGS):
+        return _TIME_STRINGS[minutes]
     hours = minutes // 60
     mins = minutes % 60
     return f"{hours:02d}:{mins:02d}:00"
 
 
+_WEEK_DAY_NUMBERS = {
+    'Week1Monday': 1, 'Week1Tuesday': 2, 'Week1Wednesday': 3,
+    'Week1Thursday': 4, 'Week1Friday': 5,
+    'Week2Monday': 8, 'Week2Tuesday': 9, 'Week2Wednesday': 10,
+    'Week2Thursday': 11, 'Week2Friday': 12
+}
+
+
 def extract_day_numbers(day_enum):
     """Extract day numbers from Day enum."""
     if isinstance(day_enum, int):
         return [day_enum]
     
-    day_str = str(day_enum)
-    
-    if 'Week1' in day_str or 'Week2' in day_str:
-        day_map = {
-            'Week1Monday': 1, 'Week1Tuesday': 2, 'Week1Wednesday': 3,
-            'Week1Thursday': 4, 'Week1Friday': 5,
-            'Week2Monday': 8, 'Week2Tuesday': 9, 'Week2Wednesday': 10,
-            'Week2Thursday': 11, 'Week2Friday': 12
-        }
-        for key, val in day_map.items():
-            if key in day_str:
-                return [val]
-    
-    return [day_enum] if isinstance(day_enum, int) else []
+    day_num = _WEEK_DAY_NUMBERS.get(getattr(day_enum, 'name', day_enum))
+    return [day_num] if day_num is not None else []
+
+
+def iter_day_numbers(days):
+    """Yield the day numbers for every entry of an element's day list."""
+    for day_enum in days:
+        yield from extract_day_numbers(day_enum)
+
+
+def _component_rows(course: Course, componentcode: str, elements, termcode: str,
+                    building: str = '', room: str = ''):
+    """Yield COPY rows for each scheduled day of a course's tutorials or labs."""
+    prefix = (course.subject, course.catalog_nbr, course.class_nbr,
+              componentcode, termcode, course.class_nbr, building, room)
+    for element in elements:
+        base_row = prefix + (minutes_to_time(element.start), minutes_to_time(element.end))
+        for day_num in iter_day_numbers(element.day):
+            yield base_row + day_number_to_day_flags(day_num)
 
 
 def insert_schedule_records(schedule: List[Course], room_assignments,
@@ -106,73 +140,24 @@ def insert_schedule_records(schedule: List[Course], room_assignments,
     cursor = conn.cursor()
     
     try:
-        count = 0
+        rows = []
+        rooms = build_room_lookup(room_assignments)
         
         for course in schedule:
-            building = ''
-            room = ''
-            
-            if isinstance(room_assignments, list):
-                for assignment in room_assignments:
-                    if (assignment.subject.strip().upper() == course.subject.upper() and 
-                        course.catalog_nbr in assignment.catalog_nbrs):
-                        building = assignment.bldg
-                        room = assignment.room
-                        break
-            elif isinstance(room_assignments, dict):
-                key = (course.subject, course.catalog_nbr)
-                building, room = room_assignments.get(key, ('', ''))
+            building, room = rooms.get((course.subject.upper(), course.catalog_nbr), ('', ''))
             
             if course.tutorial:
-                for tut_idx, tut in enumerate(course.tutorial):
-                    for day_enum in tut.day:
-                        day_numbers = extract_day_numbers(day_enum)
-                        
-                        for day_num in day_numbers:
-                            day_cols = day_number_to_day_columns(day_num)
-                            
-                            cursor.execute("""
-                                INSERT INTO optimized_schedule
-                                (subject, catalog, section, componentcode, termcode, classnumber,
-                                 buildingcode, room, classstarttime, classendtime,
-                                 mondays, tuesdays, wednesdays, thursdays, fridays, saturdays, sundays)
-                                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                            """, (
-                                course.subject, course.catalog_nbr, course.class_nbr,
-                                'TUT', termcode, course.class_nbr,
-                                '', '', minutes_to_time(tut.start), minutes_to_time(tut.end),
-                                day_cols['mondays'], day_cols['tuesdays'], day_cols['wednesdays'],
-                                day_cols['thursdays'], day_cols['fridays'], day_cols['saturdays'],
-                                day_cols['sundays']
-                            ))
-                            count += 1
+                rows.extend(_component_rows(course, 'TUT', course.tutorial, termcode))
             
             if course.lab:
-                for lab_idx, lab in enumerate(course.lab):
-                    for day_enum in lab.day:
-                        day_numbers = extract_day_numbers(day_enum)
-                        
-                        for day_num in day_numbers:
-                            day_cols = day_number_to_day_columns(day_num)
-                            
-                            cursor.execute("""
-                                INSERT INTO optimized_schedule
-                                (subject, catalog, section, componentcode, termcode, classnumber,
-                                 buildingcode, room, classstarttime, classendtime,
-                                 mondays, tuesdays, wednesdays, thursdays, fridays, saturdays, sundays)
-                                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                            """, (
-                                course.subject, course.catalog_nbr, course.class_nbr,
-                                'LAB', termcode, course.class_nbr,
-                                building, room, minutes_to_time(lab.start), minutes_to_time(lab.end),
-                                day_cols['mondays'], day_cols['tuesdays'], day_cols['wednesdays'],
-                                day_cols['thursdays'], day_cols['fridays'], day_cols['saturdays'],
-                                day_cols['sundays']
-                            ))
-                            count += 1
+                rows.extend(_component_rows(course, 'LAB', course.lab, termcode, building, room))
         
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        buffer.seek(0)
+        cursor.copy_expert(COPY_SCHEDULE_SQL, buffer)
         conn.commit()
-        return count
+        return len(rows)
         
     except Exception:
         conn.rollback()
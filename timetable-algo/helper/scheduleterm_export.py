@@ -1,14 +1,29 @@
 # scheduleterm_export.py
 from typing import List, Dict, Tuple
 from datetime import date
+from psycopg2.extras import execute_batch
 from .db import get_connection, fetch_all
+from .db_timetable_export import extract_day_numbers, minutes_to_time
 from genetic_algo.course import Course
+from genetic_algo.course_filter import EXCLUDED_ELEC_COURSES
+from genetic_algo.room_management import build_room_lookup
 
 
-EXCLUDED_COURSES = {
-    ('ELEC', '430'), ('ELEC', '434'), ('ELEC', '436'), ('ELEC', '438'),
-    ('ELEC', '446'), ('ELEC', '443'), ('ELEC', '498')
-}
+INSERT_SCHEDULETERM_SQL = """
+    INSERT INTO optimized_schedule
+    (subject, catalog, section, componentcode, termcode, classnumber,
+     session, buildingcode, room, instructionmodecode, locationcode,
+     currentwaitlisttotal, waitlistcapacity, enrollmentcapacity, currentenrollment,
+     departmentcode, facultycode, classstarttime, classendtime,
+     classstartdate, classenddate,
+     mondays, tuesdays, wednesdays, thursdays, fridays, saturdays, sundays,
+     facultydescription, career, meetingpatternnumber)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
+            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+
+EXCLUDED_COURSES = frozenset(('ELEC', catalog) for catalog in EXCLUDED_ELEC_COURSES)
 
 
 def should_exclude_course(subject: str, catalog: str) -> bool:
@@ -18,8 +33,7 @@ def should_exclude_course(subject: str, catalog: str) -> bool:
 
 def build_termcode(year: int, season: int) -> str:
     """Build termcode from year and season (Format: 2 + YY + S)."""
-    year_suffix = str(year)[-2:]
-    return f"2{year_suffix}{season}"
+    return f"2{year % 100:02d}{season}"
 
 
 def get_session_code(season: int, previous_session: str = None) -> str:
@@ -186,13 +200,6 @@ def create_scheduleterm_table():
         conn.close()
 
 
-def minutes_to_time(minutes: int) -> str:
-    """Convert minutes since midnight to HH:MM:SS format."""
-    hours = minutes // 60
-    mins = minutes % 60
-    return f"{hours:02d}:{mins:02d}:00"
-
-
 def day_number_to_day_columns(day_num: int) -> Dict[str, bool]:
     """Convert day number to boolean day columns (1-5 Week 1, 8-12 Week 2)."""
     day_map = {
@@ -228,27 +235,6 @@ def combine_day_columns(day_numbers: List[int]) -> Dict[str, bool]:
     return result
 
 
-def extract_day_numbers(day_enum):
-    """Extract day numbers from Day enum."""
-    if isinstance(day_enum, int):
-        return [day_enum]
-    
-    day_str = str(day_enum)
-    
-    if 'Week1' in day_str or 'Week2' in day_str:
-        day_map = {
-            'Week1Monday': 1, 'Week1Tuesday': 2, 'Week1Wednesday': 3,
-            'Week1Thursday': 4, 'Week1Friday': 5,
-            'Week2Monday': 8, 'Week2Tuesday': 9, 'Week2Wednesday': 10,
-            'Week2Thursday': 11, 'Week2Friday': 12
-        }
-        for key, val in day_map.items():
-            if key in day_str:
-                return [val]
-    
-    return [day_enum] if isinstance(day_enum, int) else []
-
-
 def insert_lecture_records(termcode: str, season: int, previous_termcode: str) -> int:
     """Insert lecture records from previous year into optimized_schedule."""
     conn = get_connection()
@@ -272,7 +258,7 @@ def insert_lecture_records(termcode: str, season: int, previous_termcode: str) -
         
         lectures = fetch_all(sql, (previous_termcode,))
         
-        count = 0
+        rows = []
         session_code = get_session_code(season)
         start_date, end_date = get_class_dates(season, 'LEC', session_code)
         
@@ -280,18 +266,7 @@ def insert_lecture_records(termcode: str, season: int, previous_termcode: str) -
             if should_exclude_course(lec['subject'], lec['catalog']):
                 continue
             
-            cursor.execute("""
-                INSERT INTO optimized_schedule
-                (subject, catalog, section, componentcode, termcode, classnumber,
-                 session, buildingcode, room, instructionmodecode, locationcode,
-                 currentwaitlisttotal, waitlistcapacity, enrollmentcapacity, currentenrollment,
-                 departmentcode, facultycode, classstarttime, classendtime,
-                 classstartdate, classenddate,
-                 mondays, tuesdays, wednesdays, thursdays, fridays, saturdays, sundays,
-                 facultydescription, career, meetingpatternnumber)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, (
+            rows.append((
                 lec['subject'], lec['catalog'], lec['section'], 'LEC', termcode,
                 lec['classnumber'], session_code, lec['buildingcode'], lec['room'],
                 lec['instructionmodecode'], lec['locationcode'],
@@ -304,10 +279,10 @@ def insert_lecture_records(termcode: str, season: int, previous_termcode: str) -
                 lec['thursdays'], lec['fridays'], lec['saturdays'], lec['sundays'],
                 lec['facultydescription'], lec['career'], 1
             ))
-            count += 1
         
+        execute_batch(cursor, INSERT_SCHEDULETERM_SQL, rows, page_size=500)
         conn.commit()
-        return count
+        return len(rows)
         
     except Exception:
         conn.rollback()
@@ -325,26 +300,16 @@ def insert_optimized_components(schedule: List[Course], room_assignments,
     cursor = conn.cursor()
     
     try:
-        count = 0
+        rows = []
         tutorial_count = 0
         lab_count = 0
+        rooms = build_room_lookup(room_assignments)
         
         for course in schedule:
             if should_exclude_course(course.subject, course.catalog_nbr):
                 continue
             
-            building = ''
-            room = ''
-            if isinstance(room_assignments, list):
-                for assignment in room_assignments:
-                    if (assignment.subject.strip().upper() == course.subject.upper() and 
-                        course.catalog_nbr in assignment.catalog_nbrs):
-                        building = assignment.bldg
-                        room = assignment.room
-                        break
-            elif isinstance(room_assignments, dict):
-                key = (course.subject, course.catalog_nbr)
-                building, room = room_assignments.get(key, ('', ''))
+            building, room = rooms.get((course.subject.upper(), course.catalog_nbr), ('', ''))
             
             section = course.class_nbr
             
@@ -368,18 +333,7 @@ def insert_optimized_components(schedule: List[Course], room_assignments,
                     
                     day_cols = combine_day_columns(all_day_numbers)
                     
-                    cursor.execute("""
-                        INSERT INTO optimized_schedule
-                        (subject, catalog, section, componentcode, termcode, classnumber,
-                         session, buildingcode, room, instructionmodecode, locationcode,
-                         currentwaitlisttotal, waitlistcapacity, enrollmentcapacity, currentenrollment,
-                         departmentcode, facultycode, classstarttime, classendtime,
-                         classstartdate, classenddate,
-                         mondays, tuesdays, wednesdays, thursdays, fridays, saturdays, sundays,
-                         facultydescription, career, meetingpatternnumber)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    """, (
+                    rows.append((
                         course.subject, course.catalog_nbr, section, 'TUT', termcode,
                         prev_tut['classnumber'], session, '', '', instruction_mode, location,
                         0, 0, 0, 0, 'ELECCOEN', 'ENCS',
@@ -390,7 +344,6 @@ def insert_optimized_components(schedule: List[Course], room_assignments,
                         day_cols['sundays'],
                         'Gina Cody School of Engineering & Computer Science', career, 1
                     ))
-                    count += 1
                     tutorial_count += 1
             
             if course.lab:
@@ -414,18 +367,7 @@ def insert_optimized_components(schedule: List[Course], room_assignments,
                     start_date, end_date = get_class_dates(season, 'LAB', session, all_day_numbers)
                     day_cols = combine_day_columns(all_day_numbers)
                     
-                    cursor.execute("""
-                        INSERT INTO optimized_schedule
-                        (subject, catalog, section, componentcode, termcode, classnumber,
-                         session, buildingcode, room, instructionmodecode, locationcode,
-                         currentwaitlisttotal, waitlistcapacity, enrollmentcapacity, currentenrollment,
-                         departmentcode, facultycode, classstarttime, classendtime,
-                         classstartdate, classenddate,
-                         mondays, tuesdays, wednesdays, thursdays, fridays, saturdays, sundays,
-                         facultydescription, career, meetingpatternnumber)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    """, (
+                    rows.append((
                         course.subject, course.catalog_nbr, section, 'LAB', termcode,
                         prev_lab['classnumber'], session, buildingcode, room,
                         instruction_mode, location,
@@ -438,11 +380,11 @@ def insert_optimized_components(schedule: List[Course], room_assignments,
                         day_cols['sundays'],
                         'Gina Cody School of Engineering & Computer Science', career, 1
                     ))
-                    count += 1
                     lab_count += 1
         
+        execute_batch(cursor, INSERT_SCHEDULETERM_SQL, rows, page_size=500)
         conn.commit()
-        return count
+        return len(rows)
         
     except Exception:
         conn.rollback()